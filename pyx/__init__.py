@@ -79,7 +79,7 @@ from .lib.auth import auth, User, Session
 from .lib.audit import Audit, track_activity
 from .lib.email import email, Email
 from .lib.jobs import jobs, BackgroundWorker
-from .lib.validation import validate, validate_or_fail, Validator, ValidationError
+from .lib.validation import validate, validate_batch, validate_or_fail, Validator, ValidationError
 from .lib.seo import Head, seo, Metadata, OpenGraph, TwitterCard, JSONLD
 from .lib.i18n import i18n, t, locale, Locale, LocaleMiddleware
 from .lib.pwa import PWA, PWAConfig, PWAIcon, pwa_head
@@ -89,7 +89,7 @@ from .lib.pwa import PWA, PWAConfig, PWAIcon, pwa_head
 # =========================================================================
 
 # Testing (test.*)
-from .core.testing import test, TestClient, TestResponse, TestDatabase
+from .core.testing import test, TestClient, AsyncTestClient, TestResponse, TestDatabase
 
 # Logging (log.*)
 from .core.logging import log, ZenLogger, LogLevel
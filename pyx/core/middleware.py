@@ -194,24 +194,35 @@ class AuthMiddleware:
     
     async def __call__(self, request, call_next):
         path = request.scope.get("path", "/")
+        from ..lib.auth import auth, _current_user_var, _pending_token_var, _request_token_var
+        
+        # Check for session token in cookies or headers
+        cookies = request.cookies
+        token = cookies.get("pyx_session")
+        
+        if not token:
+            # Try header
+            token = request.headers.get("Authorization", "").replace("Bearer ", "")
+        token = token or None
         
         if self._is_protected(path):
-            # Check for session token in cookies or headers
-            from ..lib.auth import auth
-            
-            # Try to get token from cookie
-            cookies = request.cookies
-            token = cookies.get("pyx_session")
-            
-            if not token:
-                # Try header
-                token = request.headers.get("Authorization", "").replace("Bearer ", "")
-            
-            if not token or not auth.get_user(token):
+            user = auth.get_user(token) if token else None
+            if user is None:
                 from fastapi.responses import RedirectResponse
                 return RedirectResponse(url=self.login_path, status_code=302)
+            user_reset = _current_user_var.set(user)
+        else:
+            # Elsewhere (public pages, assets) only hit the session store if
+            # something actually asks for auth.current_user()
+            user_reset = _pending_token_var.set(token)
         
-        return await call_next(request)
+        # Published on every path so auth.logout() can end this session
+        token_reset = _request_token_var.set(token)
+        try:
+            return await call_next(request)
+        finally:
+            _request_token_var.reset(token_reset)
+            user_reset.var.reset(user_reset)
 
 
 class ErrorHandlerMiddleware:
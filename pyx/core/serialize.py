@@ -0,0 +1,39 @@
+"""
+PyX JSON Serialization
+One dumps() for the framework: orjson when installed, stdlib json otherwise.
+"""
+import json
+from datetime import date, datetime, time
+from typing import Any
+
+try:
+    import orjson  # Optional speedup (pip install usepyx[fast])
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    # Match orjson's output for the types it handles natively
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data: Any) -> str:
+    """
+    Serialize to a JSON string.
+    
+    Uses orjson when available and falls back to json.dumps for values
+    orjson rejects (e.g. integers over 64 bits), so output doesn't depend
+    on which backend is installed.
+    
+    Usage:
+        from pyx.core.serialize import dumps
+        payload = dumps({"type": "ping"})
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, default=_default)
@@ -435,8 +435,9 @@ class App:
         for model in models:
             view = AdminView(model)
             
-            # List Route
-            self.add_page(view.prefix, view.render_list)
+            # List Route (paged; reads ?page= and ?q=)
+            self.routes[view.prefix] = view.render_list
+            self.api.add_api_route(view.prefix, self._admin_list_page(view), methods=["GET"], response_class=HTMLResponse)
             
             # Create Route
             self.add_page(f"{view.prefix}/create", view.render_form)
@@ -459,6 +460,23 @@ class App:
                 
             return Response(content=data, media_type="image/webp")
 
+    def _admin_list_page(self, view):
+        """GET handler for an admin list view, passing page/q from the query string"""
+        async def list_page(request: Request):
+            try:
+                page = max(int(request.query_params.get("page", 0)), 0)
+            except ValueError:
+                page = 0
+            q = request.query_params.get("q") or None
+            try:
+                content = view.render_list(page=page, q=q).render()
+                return self._wrap_html(content, metadata=self.routes_meta.get(view.prefix))
+            except Exception:
+                import traceback
+                traceback.print_exc()
+                return HTMLResponse(content=f"<h1>Error</h1><pre>{traceback.format_exc()}</pre>", status_code=500)
+        return list_page
+
     def add_page(self, route, component_func, title=None, description=None, image=None, metadata=None, sitemap=None):
         # Register route for dynamic rendering
         self.routes[route] = component_func
@@ -326,12 +326,24 @@ class ZenStorage:
         files = storage.list("avatars/")
     """
     
+    # Backend methods that need no argument rewriting; these are bound
+    # directly onto the instance so calls skip the _backend indirection.
+    _DIRECT = ('download', 'delete', 'exists', 'url', 'list')
+    
     def __init__(self):
-        self._backend: StorageBackend = LocalStorage()
+        self._set_backend(LocalStorage())
+    
+    def _set_backend(self, backend: StorageBackend):
+        """Swap backend and rebind its methods onto this instance"""
+        self._backend = backend
+        for name in self._DIRECT:
+            setattr(self, name, getattr(backend, name))
+        self.get = self.download
+        self.remove = self.delete
     
     def use_local(self, path: str = "./uploads", base_url: str = "/uploads"):
         """Use local filesystem storage"""
-        self._backend = LocalStorage(path, base_url)
+        self._set_backend(LocalStorage(path, base_url))
         return self
     
     def use_s3(
@@ -343,21 +355,21 @@ class ZenStorage:
         endpoint_url: str = None
     ):
         """Use Amazon S3 storage"""
-        self._backend = S3Storage(
+        self._set_backend(S3Storage(
             bucket=bucket,
             region=region,
             access_key=access_key,
             secret_key=secret_key,
             endpoint_url=endpoint_url
-        )
+        ))
         return self
     
     def use_gcs(self, bucket: str, credentials_path: str = None):
         """Use Google Cloud Storage"""
-        self._backend = GCSStorage(
+        self._set_backend(GCSStorage(
             bucket=bucket,
             credentials_path=credentials_path
-        )
+        ))
         return self
     
     def upload(self, file, folder: str = None, filename: str = None) -> str:
@@ -14,7 +14,7 @@ import asyncio
 import threading
 from typing import Callable, Any, Optional, Dict
 from functools import wraps
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, Future
 import traceback
 
 
@@ -22,6 +22,10 @@ import traceback
 _executor = ThreadPoolExecutor(max_workers=4)
 
 
+class _TaskCancelled(BaseException):
+    """Unwinds a cancelled BackgroundTask; BaseException so 'except Exception' can't swallow it"""
+
+
 def background(func: Callable) -> Callable:
     """
     Decorator to run a function in the background without blocking the UI.
@@ -94,7 +98,11 @@ class BackgroundTask:
             on_complete=show_success,
             on_error=show_error
         )
-        task.start(file_path="data.csv")
+        future = task.start(file_path="data.csv")
+        
+        # Later
+        task.cancel()              # Stops at the next set_progress()
+        result = task.await_result(timeout=30)
     """
     
     def __init__(
@@ -111,22 +119,35 @@ class BackgroundTask:
         self.on_complete = on_complete
         self.on_error = on_error
         self.progress = 0
-        self.status = "idle"  # idle, running, completed, failed
+        self.status = "idle"  # idle, running, completed, failed, cancelled
         self.result = None
         self.error = None
+        self.future: Optional[Future] = None
+        self._cancel_event = threading.Event()
     
     def set_progress(self, percent: int, message: str = ""):
         """Update task progress (call from within the task function)."""
+        if self._cancel_event.is_set():
+            raise _TaskCancelled(self.name)
         self.progress = percent
         if self.on_progress:
             self.on_progress(percent, message)
     
-    def start(self, *args, **kwargs):
-        """Start the task in background."""
+    def start(self, *args, **kwargs) -> Future:
+        """Start the task in background and return its Future."""
         self.status = "running"
         self.progress = 0
+        self.result = None
+        self.error = None
+        self._cancel_event.clear()
+        
+        # Stays pending until run() finishes, so cancel() can still resolve
+        # it as cancelled while the function is executing
+        future = Future()
         
         def run():
+            if future.cancelled():
+                return
             try:
                 # Inject task reference for progress updates
                 kwargs['_task'] = self
@@ -135,21 +156,19 @@ class BackgroundTask:
                     loop = asyncio.new_event_loop()
                     asyncio.set_event_loop(loop)
                     try:
-                        self.result = loop.run_until_complete(
+                        result = loop.run_until_complete(
                             self.func(*args, **kwargs)
                         )
                     finally:
                         loop.close()
                 else:
-                    self.result = self.func(*args, **kwargs)
-                
-                self.status = "completed"
-                self.progress = 100
-                
-                if self.on_complete:
-                    self.on_complete(self.result)
-                    
+                    result = self.func(*args, **kwargs)
+            except _TaskCancelled:
+                self.status = "cancelled"
+                return
             except Exception as e:
+                if not future.set_running_or_notify_cancel():
+                    return  # Cancelled meanwhile; nobody is waiting for the error
                 self.status = "failed"
                 self.error = e
                 
@@ -157,9 +176,41 @@ class BackgroundTask:
                     self.on_error(e)
                 else:
                     traceback.print_exc()
+                future.set_exception(e)
+                return
+            
+            if not future.set_running_or_notify_cancel():
+                return  # Cancelled after the last set_progress(); drop the result
+            self.result = result
+            self.status = "completed"
+            self.progress = 100
+            
+            if self.on_complete:
+                self.on_complete(result)
+            future.set_result(result)
         
+        self.future = future
         _executor.submit(run)
-        print(f"[BackgroundTask] Started: {self.name}")
+        return future
+    
+    def cancel(self) -> bool:
+        """
+        Request cancellation. Returns True if the task will not complete.
+        
+        A task that has not started yet never runs; a running task stops at
+        its next set_progress() call, and its Future reports cancelled.
+        """
+        if self.future is None or not self.future.cancel():
+            return False  # Not started, or already finished
+        self._cancel_event.set()
+        self.status = "cancelled"
+        return True
+    
+    def await_result(self, timeout: Optional[float] = None) -> Any:
+        """Block until the task finishes and return its result (re-raises errors)."""
+        if self.future is None:
+            raise RuntimeError(f"Task '{self.name}' has not been started")
+        return self.future.result(timeout)
 
 
 def run_async(coro):
@@ -3,8 +3,29 @@ PyX Testing Utilities
 Helpers for testing PyX applications with pytest.
 """
 from typing import Optional, Dict, Any
+from weakref import WeakKeyDictionary
 import json
 
+from ..lib.validation import validate as _validate
+
+# The ORM-backed helpers need sqlmodel; keep this module importable without it
+try:
+    from ..data.database import db as _db
+    from ..lib.auth import auth as _auth, User as _User
+except ImportError:
+    _db = _auth = _User = None
+
+
+def _require_db():
+    if _db is None:
+        raise ImportError("Please install 'sqlmodel' for database testing: pip install sqlmodel")
+
+
+_UNSET = object()
+
+# One FastAPI TestClient per app, shared across TestClient wrappers
+_client_cache: "WeakKeyDictionary[Any, Any]" = WeakKeyDictionary()
+
 
 class TestClient:
     """
@@ -41,12 +62,19 @@ class TestClient:
         self._setup_client()
     
     def _setup_client(self):
-        """Setup FastAPI TestClient"""
+        """Setup FastAPI TestClient (reused per app, cookies reset)"""
+        cached = _client_cache.get(self.app)
+        if cached is not None:
+            cached.cookies.clear()
+            self._client = cached
+            return
+        
         try:
             from fastapi.testclient import TestClient as FastAPITestClient
             self._client = FastAPITestClient(self.app.api)
         except ImportError:
             raise ImportError("Please install 'httpx' for testing: pip install httpx")
+        _client_cache[self.app] = self._client
     
     def get(self, path: str, **kwargs) -> "TestResponse":
         """Send GET request"""
@@ -89,11 +117,110 @@ class TestClient:
         return TestResponse(response)
 
 
+class AsyncTestClient:
+    """
+    Async test client that drives the ASGI app in-process via httpx.
+    
+    Unlike TestClient, requests can be issued concurrently from one test.
+    Startup/shutdown handlers run once when used as an async context manager.
+    
+    Usage:
+        from pyx.testing import AsyncTestClient
+        from main import app
+        
+        async def test_many_items():
+            async with AsyncTestClient(app) as client:
+                responses = await asyncio.gather(
+                    *[client.get(f"/items/{i}") for i in range(100)]
+                )
+                assert all(r.status_code == 200 for r in responses)
+    """
+    
+    def __init__(self, app, base_url: str = "http://test"):
+        """
+        Initialize async test client.
+        
+        Args:
+            app: PyX App instance
+            base_url: Base URL used for relative request paths
+        """
+        self.app = app
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("Please install 'httpx' for testing: pip install httpx")
+        
+        self._client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app.api),
+            base_url=base_url
+        )
+        self._lifespan = None
+    
+    async def __aenter__(self) -> "AsyncTestClient":
+        self._lifespan = self.app.api.router.lifespan_context(self.app.api)
+        await self._lifespan.__aenter__()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            await self._lifespan.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._lifespan = None
+            await self.aclose()
+    
+    async def aclose(self):
+        """Close the underlying httpx client"""
+        await self._client.aclose()
+    
+    async def get(self, path: str, **kwargs) -> "TestResponse":
+        """Send GET request"""
+        response = await self._client.get(path, **kwargs)
+        return TestResponse(response)
+    
+    async def post(self, path: str, data: Dict = None, json_data: Dict = None, **kwargs) -> "TestResponse":
+        """Send POST request"""
+        if data:
+            response = await self._client.post(path, data=data, **kwargs)
+        elif json_data:
+            response = await self._client.post(path, json=json_data, **kwargs)
+        else:
+            response = await self._client.post(path, **kwargs)
+        return TestResponse(response)
+    
+    async def put(self, path: str, data: Dict = None, json_data: Dict = None, **kwargs) -> "TestResponse":
+        """Send PUT request"""
+        if data:
+            response = await self._client.put(path, data=data, **kwargs)
+        elif json_data:
+            response = await self._client.put(path, json=json_data, **kwargs)
+        else:
+            response = await self._client.put(path, **kwargs)
+        return TestResponse(response)
+    
+    async def delete(self, path: str, **kwargs) -> "TestResponse":
+        """Send DELETE request"""
+        response = await self._client.delete(path, **kwargs)
+        return TestResponse(response)
+    
+    async def patch(self, path: str, data: Dict = None, json_data: Dict = None, **kwargs) -> "TestResponse":
+        """Send PATCH request"""
+        if data:
+            response = await self._client.patch(path, data=data, **kwargs)
+        elif json_data:
+            response = await self._client.patch(path, json=json_data, **kwargs)
+        else:
+            response = await self._client.patch(path, **kwargs)
+        return TestResponse(response)
+
+
 class TestResponse:
     """Wrapper for test response with convenient assertions"""
     
     def __init__(self, response):
         self._response = response
+        self._json_cache = _UNSET
+        self._headers_cache = None
+        self._cookies_cache = None
     
     @property
     def status_code(self) -> int:
@@ -107,18 +234,24 @@ class TestResponse:
     
     @property
     def json(self) -> Dict:
-        """Get response body as JSON"""
-        return self._response.json()
+        """Get response body as JSON (parsed once)"""
+        if self._json_cache is _UNSET:
+            self._json_cache = self._response.json()
+        return self._json_cache
     
     @property
     def headers(self) -> Dict:
         """Get response headers"""
-        return dict(self._response.headers)
+        if self._headers_cache is None:
+            self._headers_cache = dict(self._response.headers)
+        return self._headers_cache
     
     @property
     def cookies(self) -> Dict:
         """Get response cookies"""
-        return dict(self._response.cookies)
+        if self._cookies_cache is None:
+            self._cookies_cache = dict(self._response.cookies)
+        return self._cookies_cache
     
     def assert_status(self, status_code: int) -> "TestResponse":
         """Assert response status code"""
@@ -193,33 +326,61 @@ class TestDatabase:
             # Database is automatically cleaned up
     """
     
-    def __init__(self, url: str = "sqlite:///:memory:"):
+    # Named in-memory database opened in SQLite shared-cache mode: every
+    # connection of the engine sees the same tables, with no disk I/O.
+    # See https://www.sqlite.org/sharedcache.html#shared_cache_and_in_memory_databases
+    SHARED_MEMORY_URL = "sqlite:///file:pyx_test?mode=memory&cache=shared&uri=true"
+    
+    def __init__(self, url: str = None, shared: bool = True):
         """
         Initialize test database.
         
         Args:
             url: Database URL (default: in-memory SQLite)
+            shared: When using the default in-memory database, share it across
+                all connections (pool threads, async workers). Set False for a
+                private per-connection database in isolated unit tests.
         """
-        self.url = url
+        self.shared = shared and url is None
+        self.url = url or (self.SHARED_MEMORY_URL if shared else "sqlite:///:memory:")
         self._original_engine = None
+        self._original_url = None
+        self._original_sessionmaker = None
     
     def __enter__(self):
-        from ..data.database import db
+        _require_db()
+        db = _db
         
         # Save original engine
-        self._original_engine = db._engine
+        self._original_engine = db.engine
+        self._original_url = db.url
+        self._original_sessionmaker = db._sessionmaker
         
         # Connect to test database
-        db.connect(self.url)
+        if self.shared:
+            from sqlalchemy.pool import StaticPool
+            db.connect(
+                self.url,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool
+            )
+        else:
+            db.connect(self.url)
         db.init()
         
         return db
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        from ..data.database import db
+        db = _db
+        
+        # Dropping the last connection frees the in-memory database
+        if db.engine is not None and db.engine is not self._original_engine:
+            db.engine.dispose()
         
         # Restore original engine
-        db._engine = self._original_engine
+        db.engine = self._original_engine
+        db.url = self._original_url
+        db._sessionmaker = self._original_sessionmaker
 
 
 def mock_auth_user(email: str = "test@example.com", role: str = "user"):
@@ -235,16 +396,17 @@ def mock_auth_user(email: str = "test@example.com", role: str = "user"):
                 response = client.get("/admin")
                 assert response.status_code == 200
     """
-    from ..lib.auth import auth, User
+    _require_db()
+    auth, User = _auth, _User
     
     class MockAuthContext:
         def __init__(self, email: str, role: str):
             self.email = email
             self.role = role
-            self._original_user = None
+            self._reset_token = None
         
         def __enter__(self):
-            self._original_user = auth._current_user
+            from ..lib.auth import _current_user_var
             
             # Create mock user
             mock_user = User(
@@ -256,11 +418,12 @@ def mock_auth_user(email: str = "test@example.com", role: str = "user"):
             )
             mock_user.password_hash = ""
             
-            auth._current_user = mock_user
+            self._reset_token = _current_user_var.set(mock_user)
             return mock_user
         
         def __exit__(self, exc_type, exc_val, exc_tb):
-            auth._current_user = self._original_user
+            from ..lib.auth import _current_user_var
+            _current_user_var.reset(self._reset_token)
     
     return MockAuthContext(email, role)
 
@@ -277,9 +440,7 @@ def assert_validation_fails(data: Dict, rules: Dict, expected_fields: list = Non
             expected_fields=["email"]
         )
     """
-    from ..lib.validation import validate
-    
-    errors = validate(data, rules)
+    errors = _validate(data, rules)
     assert len(errors) > 0, "Validation should have failed but passed"
     
     if expected_fields:
@@ -297,9 +458,7 @@ def assert_validation_passes(data: Dict, rules: Dict):
             {"email": ["required", "email"]}
         )
     """
-    from ..lib.validation import validate
-    
-    errors = validate(data, rules)
+    errors = _validate(data, rules)
     assert len(errors) == 0, f"Validation should have passed but failed: {errors}"
 
 
@@ -333,6 +492,7 @@ class ZenTest:
     
     # Re-export classes
     Client = TestClient
+    AsyncClient = AsyncTestClient
     Response = TestResponse
     Database = TestDatabase
     
@@ -342,9 +502,42 @@ class ZenTest:
         return TestClient(app)
     
     @staticmethod
-    def database(url: str = "sqlite:///:memory:") -> TestDatabase:
+    def async_client(app) -> AsyncTestClient:
+        """
+        Create async test client for app.
+        
+        Usage:
+            async with test.async_client(app) as client:
+                response = await client.get("/")
+        """
+        return AsyncTestClient(app)
+    
+    @staticmethod
+    def client_session(app):
+        """
+        Session-scoped pytest fixture yielding one TestClient for the whole run.
+        
+        Usage (conftest.py):
+            from pyx import test
+            from main import app
+            
+            client = test.client_session(app)
+            
+            def test_homepage(client):
+                client.get("/").assert_ok()
+        """
+        import pytest
+        
+        @pytest.fixture(scope="session")
+        def client():
+            return TestClient(app)
+        
+        return client
+    
+    @staticmethod
+    def database(url: str = None, shared: bool = True) -> TestDatabase:
         """Create test database context"""
-        return TestDatabase(url)
+        return TestDatabase(url, shared)
     
     @staticmethod
     def mock_user(email: str = "test@example.com", role: str = "user"):
@@ -3,14 +3,44 @@ PyX WebSocket Rooms & Presence
 Real-time collaboration features with Zen Mode access.
 """
 import asyncio
-import json
+import logging
+import secrets
+import sys
+import time
 from typing import Dict, Set, List, Any, Optional, Callable
 from datetime import datetime
 from dataclasses import dataclass, field
-from weakref import WeakSet
+from weakref import WeakSet, WeakValueDictionary
+from .serialize import dumps as _dumps
 
+logger = logging.getLogger("pyx.ws")
 
-@dataclass
+# Slotted dataclasses need 3.10+, and weakref support for them (Client lives
+# in a WeakValueDictionary) needs 3.11+; older versions keep a __dict__
+_SLOTS = {"slots": True, "weakref_slot": True} if sys.version_info >= (3, 11) else {}
+
+
+async def _fanout(clients: List["Client"], payload: str):
+    """Send to many clients concurrently; one slow socket doesn't stall the rest"""
+    results = await asyncio.gather(
+        *[c.websocket.send_text(payload) for c in clients],
+        return_exceptions=True
+    )
+    for client, result in zip(clients, results):
+        if isinstance(result, BaseException):
+            logger.warning("Send failed cid=%s", client.id, exc_info=result)
+
+
+def _log_task_exc(task: asyncio.Task):
+    """Done-callback that reports exceptions raised by async handlers"""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("WebSocket handler failed", exc_info=exc)
+
+
+@dataclass(eq=False, **_SLOTS)
 class Client:
     """Represents a connected WebSocket client"""
     id: str
@@ -18,60 +48,96 @@ class Client:
     user_id: Optional[str] = None
     user_data: Dict = field(default_factory=dict)
     rooms: Set[str] = field(default_factory=set)
-    connected_at: datetime = field(default_factory=datetime.now)
+    connected_at: float = field(default_factory=time.time)  # epoch seconds
     
     async def send(self, data: dict):
         """Send message to this client"""
         try:
-            await self.websocket.send_text(json.dumps(data))
-        except Exception as e:
-            print(f"[WS] Error sending to {self.id}: {e}")
+            await self.websocket.send_text(_dumps(data))
+        except Exception:
+            logger.warning("Send failed cid=%s", self.id, exc_info=True)
     
     async def send_text(self, text: str):
         """Send raw text to this client"""
         try:
             await self.websocket.send_text(text)
-        except Exception as e:
-            print(f"[WS] Error sending to {self.id}: {e}")
+        except Exception:
+            logger.warning("Send failed cid=%s", self.id, exc_info=True)
 
 
 class Room:
     """Represents a WebSocket room/channel"""
     
+    __slots__ = (
+        "name", "clients", "metadata", "created_at",
+        "_broadcast_cache", "_presence_cache", "_presence_json"
+    )
+    
     def __init__(self, name: str):
         self.name = name
-        self.clients: Dict[str, Client] = {}
+        self.clients: Set[Client] = set()
         self.metadata: Dict = {}
-        self.created_at = datetime.now()
+        self.created_at = time.time()
+        self._broadcast_cache: Optional[tuple] = None  # (version, payload)
+        self._presence_cache: Optional[List[dict]] = None
+        self._presence_json: Optional[str] = None
     
     def join(self, client: Client):
         """Add client to room"""
-        self.clients[client.id] = client
+        self.clients.add(client)
         client.rooms.add(self.name)
+        self.invalidate_presence()
     
     def leave(self, client: Client):
         """Remove client from room"""
-        if client.id in self.clients:
-            del self.clients[client.id]
+        self.clients.discard(client)
         client.rooms.discard(self.name)
+        self.invalidate_presence()
     
-    async def broadcast(self, data: dict, exclude: str = None):
+    async def broadcast(self, data: dict, exclude_client: Client = None):
         """Send message to all clients in room"""
-        for client_id, client in self.clients.items():
-            if client_id != exclude:
-                await client.send(data)
+        targets = [c for c in self.clients if c is not exclude_client]
+        await _fanout(targets, _dumps(data))
+    
+    async def broadcast_cached(self, version: Any, data: dict):
+        """
+        Broadcast a payload that repeats between ticks.
+        
+        The encoded payload is reused while `version` is unchanged, so
+        e.g. a game-state tick is encoded once, not once per send.
+        """
+        cached = self._broadcast_cache
+        if cached is not None and cached[0] == version:
+            payload = cached[1]
+        else:
+            payload = _dumps(data)
+            self._broadcast_cache = (version, payload)
+        await _fanout(list(self.clients), payload)
     
     def get_presence(self) -> List[dict]:
-        """Get list of connected users in room"""
-        return [
-            {
-                "client_id": c.id,
-                "user_id": c.user_id,
-                "user_data": c.user_data,
-                "connected_at": c.connected_at.isoformat()
-            }
-            for c in self.clients.values()
-        ]
+        """Get list of connected users in room (cached; treat as read-only)"""
+        if self._presence_cache is None:
+            self._presence_cache = [
+                {
+                    "client_id": c.id,
+                    "user_id": c.user_id,
+                    "user_data": c.user_data,
+                    "connected_at": datetime.fromtimestamp(c.connected_at).isoformat()
+                }
+                for c in self.clients
+            ]
+        return self._presence_cache
+    
+    def get_presence_json(self) -> str:
+        """Get presence list already encoded as JSON (cached)"""
+        if self._presence_json is None:
+            self._presence_json = _dumps(self.get_presence())
+        return self._presence_json
+    
+    def invalidate_presence(self):
+        """Drop cached presence (call after changing a member's user data)"""
+        self._presence_cache = None
+        self._presence_json = None
     
     @property
     def count(self) -> int:
@@ -118,11 +184,20 @@ class ZenWebSocket:
         users = ws.presence(f"chat:{room_id}")
     """
     
+    # Max async event handlers running at once (connection storms queue up)
+    MAX_HANDLER_TASKS = 256
+    
     def __init__(self):
-        self._clients: Dict[str, Client] = {}
+        # Weak: a client dropped without disconnect() (crash, partition) is freed
+        # once its endpoint lets go of it; room members are pruned by sweep()
+        self._clients: "WeakValueDictionary[str, Client]" = WeakValueDictionary()
+        self._user_clients: "Dict[str, WeakSet[Client]]" = {}
         self._rooms: Dict[str, Room] = {}
-        self._handlers: Dict[str, List[Callable]] = {}
+        self._handlers: Dict[str, List[tuple]] = {}  # event -> [(handler, is_coro)]
         self._client_counter = 0
+        self._id_salt = secrets.token_hex(4)
+        self._pending_tasks: Set[asyncio.Task] = set()
+        self._handler_sema: Optional[asyncio.Semaphore] = None
     
     # ====================
     # Client Management
@@ -140,8 +215,8 @@ class ZenWebSocket:
         Returns:
             Client instance
         """
-        import secrets
-        client_id = f"client_{secrets.token_hex(8)}"
+        self._client_counter += 1
+        client_id = f"client_{self._id_salt}_{self._client_counter}"
         
         client = Client(
             id=client_id,
@@ -151,6 +226,8 @@ class ZenWebSocket:
         )
         
         self._clients[client_id] = client
+        if user_id:
+            self._index_user(client, user_id)
         
         # Trigger connect handlers
         self._trigger("connect", client)
@@ -162,13 +239,15 @@ class ZenWebSocket:
         Handle client disconnection.
         Removes from all rooms and cleans up.
         """
-        # Leave all rooms
-        for room_name in list(client.rooms):
-            self.leave(room_name, client)
+        # Leave all rooms (leave() discards from client.rooms, so this drains)
+        while client.rooms:
+            self.leave(next(iter(client.rooms)), client)
         
         # Remove from clients
         if client.id in self._clients:
             del self._clients[client.id]
+        if client.user_id:
+            self._unindex_user(client, client.user_id)
         
         # Trigger disconnect handlers
         self._trigger("disconnect", client)
@@ -182,9 +261,19 @@ class ZenWebSocket:
             user_id: User identifier
             user_data: Optional user metadata (name, avatar, etc.)
         """
+        if client.user_id != user_id:
+            if client.user_id:
+                self._unindex_user(client, client.user_id)
+            if user_id:
+                self._index_user(client, user_id)
         client.user_id = user_id
         if user_data:
             client.user_data.update(user_data)
+        
+        for room_name in client.rooms:
+            room = self._rooms.get(room_name)
+            if room:
+                room.invalidate_presence()
     
     def get_client(self, client_id: str) -> Optional[Client]:
         """Get client by ID"""
@@ -192,7 +281,48 @@ class ZenWebSocket:
     
     def get_client_by_user(self, user_id: str) -> List[Client]:
         """Get all clients for a user (user may have multiple connections)"""
-        return [c for c in self._clients.values() if c.user_id == user_id]
+        return list(self._user_clients.get(user_id, ()))
+    
+    def _index_user(self, client: Client, user_id: str):
+        self._user_clients.setdefault(user_id, WeakSet()).add(client)
+    
+    def _unindex_user(self, client: Client, user_id: str):
+        clients = self._user_clients.get(user_id)
+        if clients is not None:
+            clients.discard(client)
+            if not clients:
+                del self._user_clients[user_id]
+    
+    async def sweep(self, ping_interval: float = 30):
+        """
+        Periodically ping every client and disconnect the ones that fail.
+        
+        Usage:
+            asyncio.create_task(ws.sweep())
+        """
+        while True:
+            await asyncio.sleep(ping_interval)
+            await self.sweep_once()
+    
+    async def sweep_once(self) -> int:
+        """Ping every client once; disconnect dead ones and return how many"""
+        clients = set(self._clients.values())
+        for room in list(self._rooms.values()):
+            clients.update(room.clients)
+        clients = list(clients)
+        
+        ping = _dumps({"type": "ping"})
+        results = await asyncio.gather(
+            *[c.websocket.send_text(ping) for c in clients],
+            return_exceptions=True
+        )
+        dead = [c for c, r in zip(clients, results) if isinstance(r, Exception)]
+        for client in dead:
+            self.disconnect(client)
+        # Users whose clients were all freed without disconnect()
+        for user_id in [u for u, c in self._user_clients.items() if not c]:
+            del self._user_clients[user_id]
+        return len(dead)
     
     # ====================
     # Room Management  
@@ -239,6 +369,8 @@ class ZenWebSocket:
             # Cleanup empty rooms
             if room.count == 0:
                 del self._rooms[room_name]
+        else:
+            client.rooms.discard(room_name)
     
     def get_room(self, room_name: str) -> Optional[Room]:
         """Get room by name"""
@@ -259,8 +391,36 @@ class ZenWebSocket:
         """
         room = self._rooms.get(room_name)
         if room:
-            exclude_id = exclude_client.id if exclude_client else None
-            await room.broadcast(data, exclude=exclude_id)
+            await room.broadcast(data, exclude_client)
+    
+    async def broadcast_many(self, room_names: List[str], data: dict, exclude_client: Client = None):
+        """
+        Broadcast one message to several rooms at once.
+        
+        A client in more than one of the rooms receives it only once.
+        
+        Usage:
+            await ws.broadcast_many(["tag:python", "tag:web"], post)
+        """
+        targets: Set[Client] = set()
+        for name in room_names:
+            room = self._rooms.get(name)
+            if room:
+                targets.update(room.clients)
+        targets.discard(exclude_client)
+        if targets:
+            await _fanout(list(targets), _dumps(data))
+    
+    async def broadcast_cached(self, room_name: str, version: Any, data: dict):
+        """
+        Broadcast to a room, reusing the encoded payload for a repeated version.
+        
+        Usage:
+            await ws.broadcast_cached("game:1", tick, state)
+        """
+        room = self._rooms.get(room_name)
+        if room:
+            await room.broadcast_cached(version, data)
     
     async def send_to(self, client: Client, data: dict):
         """Send message to specific client"""
@@ -268,14 +428,11 @@ class ZenWebSocket:
     
     async def send_to_user(self, user_id: str, data: dict):
         """Send message to all connections of a user"""
-        clients = self.get_client_by_user(user_id)
-        for client in clients:
-            await client.send(data)
+        await _fanout(self.get_client_by_user(user_id), _dumps(data))
     
     async def broadcast_all(self, data: dict):
         """Broadcast to all connected clients"""
-        for client in self._clients.values():
-            await client.send(data)
+        await _fanout(list(self._clients.values()), _dumps(data))
     
     # ====================
     # Presence
@@ -338,21 +495,45 @@ class ZenWebSocket:
         def decorator(func):
             if event not in self._handlers:
                 self._handlers[event] = []
-            self._handlers[event].append(func)
+            self._handlers[event].append((func, asyncio.iscoroutinefunction(func)))
             return func
         return decorator
     
     def _trigger(self, event: str, *args):
         """Trigger event handlers"""
-        handlers = self._handlers.get(event, [])
-        for handler in handlers:
-            try:
-                if asyncio.iscoroutinefunction(handler):
-                    asyncio.create_task(handler(*args))
-                else:
+        handlers = self._handlers.get(event)
+        if not handlers:
+            return
+        for handler, is_coro in handlers:
+            if is_coro:
+                self._spawn(handler, args)
+            else:
+                try:
                     handler(*args)
-            except Exception as e:
-                print(f"[WS] Error in {event} handler: {e}")
+                except Exception:
+                    logger.exception("Error in %s handler", event)
+    
+    def _spawn(self, handler: Callable, args: tuple):
+        """Run an async handler as a tracked task, bounded by the semaphore"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("No running event loop; skipped async handler %s", getattr(handler, "__name__", handler))
+            return
+        
+        if self._handler_sema is None:
+            # Created lazily so it binds to the running loop
+            self._handler_sema = asyncio.Semaphore(self.MAX_HANDLER_TASKS)
+        
+        async def run():
+            async with self._handler_sema:
+                await handler(*args)
+        
+        # Keep a strong reference until done so the task can't be GC'd mid-flight
+        task = loop.create_task(run())
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        task.add_done_callback(_log_task_exc)
     
     # ====================
     # Room Metadata
@@ -385,7 +566,7 @@ class ZenWebSocket:
             "rooms": {
                 name: {
                     "clients": room.count,
-                    "created_at": room.created_at.isoformat()
+                    "created_at": datetime.fromtimestamp(room.created_at).isoformat()
                 }
                 for name, room in self._rooms.items()
             }
@@ -3,6 +3,14 @@ PyX Database Layer
 Full ORM with Relationships support.
 """
 from sqlmodel import SQLModel, Field, Session, create_engine, select, Relationship as SQLRelationship
+from functools import lru_cache, cached_property
+from itertools import groupby
+import os
+import re
+import weakref
+from sqlalchemy import delete as sa_delete, event, insert, bindparam, func, literal, text, Integer
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import configure_mappers, sessionmaker, selectinload
 from typing import Optional, List, Any, Type, TYPE_CHECKING
 from datetime import datetime
 
@@ -39,7 +47,17 @@ def Column(
         name: str = Column()
         email: str = Column(unique=True, index=True)
         author_id: int = Column(foreign_key="user.id")
+        created_at: datetime = Column(default=datetime.utcnow)  # callables run per row
     """
+    if callable(default):
+        return Field(
+            default_factory=default,
+            primary_key=primary_key,
+            unique=unique,
+            index=index,
+            nullable=nullable,
+            foreign_key=foreign_key
+        )
     return Field(
         default=default, 
         primary_key=primary_key, 
@@ -96,6 +114,119 @@ def UpdatedAt():
     return Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow})
 
 
+# =========================================================================
+# Statement cache
+# =========================================================================
+
+def _filter_shape(filters: dict) -> tuple:
+    """Hashable description of a filter dict: (key, is_null) pairs in key order"""
+    return tuple((key, filters[key] is None) for key in sorted(filters))
+
+
+def _filter_params(filters: dict) -> dict:
+    """Bind values for a statement built from _filter_shape (NULL tests take none)"""
+    return {f"f_{key}": value for key, value in filters.items() if value is not None}
+
+
+def _query_params(filters: dict, limit: Optional[int] = None, offset: Optional[int] = None) -> dict:
+    """Bind values for a statement built by _select_statement"""
+    params = _filter_params(filters)
+    if limit:
+        params["q_limit"] = limit
+    if offset:
+        params["q_offset"] = offset
+    return params
+
+
+@lru_cache(maxsize=256)
+def _loader(model: type, relation: str):
+    """selectinload option for model.relation, or None if there is no such attribute"""
+    rel_attr = getattr(model, relation, None)
+    return selectinload(rel_attr) if rel_attr else None
+
+
+def _with_loaders(statement, model: type, relations):
+    """Add cached selectinload options for the given relation names"""
+    options = [o for o in (_loader(model, r) for r in relations) if o is not None]
+    return statement.options(*options) if options else statement
+
+
+def _apply_filters(statement, model: type, shape: tuple):
+    """Add one WHERE clause per filter in shape, bound as f_<key>"""
+    for key, is_null in shape:
+        col = getattr(model, key)
+        statement = statement.where(col.is_(None) if is_null else col == bindparam(f"f_{key}"))
+    return statement
+
+
+@lru_cache(maxsize=512)
+def _select_statement(
+    model: type,
+    shape: tuple,
+    order: Optional[str] = None,
+    desc: bool = False,
+    has_limit: bool = False,
+    has_offset: bool = False,
+    relations: tuple = ()
+):
+    """
+    Build a parameterized SELECT once per query shape.
+    
+    Filter values, limit and offset are bound at execution time
+    (see _query_params), so repeated finds skip rebuilding the statement.
+    """
+    statement = _with_loaders(select(model), model, relations)
+    statement = _apply_filters(statement, model, shape)
+    if order:
+        col = getattr(model, order)
+        statement = statement.order_by(col.desc() if desc else col)
+    if has_limit:
+        statement = statement.limit(bindparam("q_limit", type_=Integer))
+    if has_offset:
+        statement = statement.offset(bindparam("q_offset", type_=Integer))
+    return statement
+
+
+@lru_cache(maxsize=256)
+def _get_sql(model: type, dialect) -> tuple:
+    """SELECT-by-pk SQL for Database.get_raw, plus (name, result processor) per column"""
+    # model_construct instances need configured mappers to read attributes
+    configure_mappers()
+    table = model.__table__
+    pk = table.primary_key.columns[0]
+    columns = tuple(
+        (col.name, col.type.dialect_impl(dialect).result_processor(dialect, None))
+        for col in table.columns
+    )
+    names = ", ".join(f'"{name}"' for name, _ in columns)
+    return f'SELECT {names} FROM "{table.name}" WHERE "{pk.name}" = ?', columns
+
+
+@lru_cache(maxsize=512)
+def _count_statement(model: type, shape: tuple, has_limit: bool = False, has_offset: bool = False):
+    """Build a parameterized SELECT COUNT(*) once per query shape"""
+    if has_limit or has_offset:
+        # LIMIT/OFFSET bound the rows being counted, so count over a subquery
+        inner = _select_statement(model, shape, has_limit=has_limit, has_offset=has_offset)
+        return select(func.count()).select_from(inner.subquery())
+    return _apply_filters(select(func.count()).select_from(model), model, shape)
+
+
+@lru_cache(maxsize=512)
+def _delete_statement(model: type, shape: tuple):
+    """Build a parameterized DELETE once per filter shape"""
+    return _apply_filters(sa_delete(model), model, shape)
+
+
+@lru_cache(maxsize=512)
+def _exists_statement(model: type, shape: tuple, has_offset: bool = False):
+    """Build a parameterized SELECT EXISTS(...) once per query shape"""
+    inner = _apply_filters(select(literal(1)).select_from(model), model, shape)
+    if has_offset:
+        inner = inner.offset(bindparam("q_offset", type_=Integer))
+    return select(inner.exists())
+
+
 class Database:
     """
     PyX Database Engine
@@ -129,18 +260,86 @@ class Database:
         print(user.posts)  # [Post(...)]
     """
     
+    # Connection pool defaults for pooled (QueuePool) engines
+    POOL_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    
+    # Rows per multi-VALUES INSERT when bulk inserting
+    INSERT_PAGE_SIZE = 10_000
+    
+    # Run on every new SQLite connection: WAL + NORMAL sync fsyncs per
+    # checkpoint instead of per commit
+    SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA temp_store=MEMORY",
+    )
+    
     def __init__(self, url: str = "sqlite:///database.db"):
         self.url = url
         self.engine = None
         self._session = None
+        self._sessionmaker = None
+        self._fork_hook = False
         
-    def connect(self, url: str = None):
-        """Initialize database engine"""
+    def connect(self, url: str = None, **engine_kwargs):
+        """Initialize database engine (extra kwargs go to create_engine)"""
         if url:
             self.url = url
-        self.engine = create_engine(self.url, echo=False)
+        options = {
+            "insertmanyvalues_page_size": self.INSERT_PAGE_SIZE,
+            **self._pool_options(),
+            **engine_kwargs
+        }
+        self.engine = create_engine(self.url, echo=False, **options)
+        if self.engine.dialect.name == "sqlite" and self.SQLITE_PRAGMAS:
+            event.listen(self.engine, "connect", self._set_sqlite_pragmas)
+        self._sessionmaker = sessionmaker(self.engine, class_=Session, expire_on_commit=False)
+        self._register_fork_hook()
         return self
     
+    def _register_fork_hook(self):
+        """
+        Make forked children (gunicorn/uvicorn workers) open fresh connections.
+        
+        dispose(close=False) drops the inherited pool without closing the
+        parent's sockets, so one process-wide db is safe under pre-fork servers.
+        """
+        if self._fork_hook or not hasattr(os, "register_at_fork"):
+            return
+        ref = weakref.ref(self)
+        
+        def after_fork():
+            database = ref()
+            if database is not None and database.engine is not None:
+                database.engine.dispose(close=False)
+        
+        os.register_at_fork(after_in_child=after_fork)
+        self._fork_hook = True
+    
+    def _set_sqlite_pragmas(self, dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        try:
+            for pragma in self.SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+    
+    def _pool_options(self) -> dict:
+        """Pool sizing only applies to QueuePool; in-memory SQLite uses a single-connection pool"""
+        url = make_url(self.url)
+        if url.get_backend_name() == "sqlite" and (
+            url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+        ):
+            return {}
+        return dict(self.POOL_OPTIONS)
+    
     def init(self):
         """Create all tables from registered Models"""
         if not self.engine:
@@ -156,7 +355,7 @@ class Database:
         """Get database session"""
         if not self.engine:
             self.connect()
-        return Session(self.engine)
+        return self._sessionmaker()
     
     # =========================================================================
     # CRUD Operations
@@ -170,15 +369,74 @@ class Database:
             session.refresh(obj)
             return obj
     
-    def save_all(self, objects: List[Model]) -> List[Model]:
-        """Bulk insert/update"""
+    def save_all(self, objects: List[Model], refresh: bool = False) -> List[Model]:
+        """
+        Bulk insert/update.
+        
+        New objects (primary key unset) are inserted with one batched INSERT
+        per model; their generated keys are NOT loaded back. Objects that
+        already have a key are added through the ORM as before. Pass
+        refresh=True for the slower legacy path that adds and reloads every
+        object (use it when you need the new ids).
+        """
+        if refresh:
+            with self.session() as session:
+                for obj in objects:
+                    session.add(obj)
+                session.commit()
+                for obj in objects:
+                    session.refresh(obj)
+                return objects
+        
+        new_by_model = {}
+        existing = []
+        for obj in objects:
+            pk = type(obj).__table__.primary_key.columns
+            if all(getattr(obj, col.name) is None for col in pk):
+                new_by_model.setdefault(type(obj), []).append(obj)
+            else:
+                existing.append(obj)
+        
         with self.session() as session:
-            for obj in objects:
+            for model, group in new_by_model.items():
+                self._bulk_insert(session, model, group)
+            for obj in existing:
                 session.add(obj)
             session.commit()
-            for obj in objects:
-                session.refresh(obj)
-            return objects
+        return objects
+    
+    def bulk_save_mappings(self, model: type, rows: List[dict]) -> int:
+        """
+        Insert plain dicts in one batched INSERT, skipping model construction.
+        
+        Usage:
+            db.bulk_save_mappings(User, [{"name": "A"}, {"name": "B"}])
+        """
+        if not rows:
+            return 0
+        with self.session() as session:
+            session.execute(insert(model), rows)
+            session.commit()
+        return len(rows)
+    
+    def _bulk_insert(self, session: Session, model: type, objects: List[Model]):
+        """INSERT many new objects with one executemany (batched multi-VALUES)"""
+        table = model.__table__
+        # Leave None out for columns the database fills in (autoincrement PK,
+        # default / server_default), as a single-row flush would
+        db_filled = {
+            col.name for col in table.columns
+            if col.primary_key or col.default is not None or col.server_default is not None
+        }
+        
+        rows = [
+            {k: v for k, v in obj.model_dump().items() if not (v is None and k in db_filled)}
+            for obj in objects
+        ]
+        # executemany needs the same columns in every row: batch consecutive
+        # rows by key set so insert order still follows the input list
+        for _, batch in groupby(rows, key=tuple):
+            session.execute(insert(table), list(batch))
     
     def delete(self, obj: Model) -> None:
         """Remove object from database"""
@@ -187,12 +445,27 @@ class Database:
             session.commit()
     
     def delete_by_id(self, model: type, id: int) -> bool:
-        """Delete by ID"""
-        obj = self.find_by_id(model, id)
-        if obj:
-            self.delete(obj)
-            return True
-        return False
+        """Delete by ID (single DELETE, no row is loaded)"""
+        pk = model.__table__.primary_key.columns[0]
+        with self.session() as session:
+            result = session.execute(sa_delete(model).where(pk == id))
+            session.commit()
+            return result.rowcount > 0
+    
+    def delete_many(self, model: type, **kwargs) -> int:
+        """
+        Delete every matching row in one DELETE statement. Returns rows deleted.
+        
+        Usage:
+            db.delete_many(Session, user_id=user.id)
+        """
+        if not kwargs:
+            raise ValueError("delete_many requires at least one filter")
+        statement = _delete_statement(model, _filter_shape(kwargs))
+        with self.session() as session:
+            result = session.execute(statement, _query_params(kwargs))
+            session.commit()
+            return result.rowcount
     
     # =========================================================================
     # Query Operations
@@ -213,25 +486,50 @@ class Database:
     
     # Alias
     get = find_by_id
+    
+    def get_raw(self, model: type, id: Any) -> Optional[Any]:
+        """
+        Primary-key lookup on a raw DB-API cursor, skipping ORM compile and validation.
+        
+        Read-only fast path for SQLite; other engines fall back to find_by_id.
+        The returned object has no ORM state: read its fields, but use
+        find_by_id for anything you intend to modify and save.
+        """
+        if not self.engine:
+            self.connect()
+        if self.engine.dialect.name != "sqlite":
+            return self.find_by_id(model, id)
+        
+        sql, columns = _get_sql(model, self.engine.dialect)
+        raw = self.engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            cursor.execute(sql, (id,))
+            row = cursor.fetchone()
+            cursor.close()
+        finally:
+            raw.close()
+        if row is None:
+            return None
+        return model.model_construct(**{
+            name: proc(value) if proc and value is not None else value
+            for (name, proc), value in zip(columns, row)
+        })
             
     def find_by(self, model: type, **kwargs) -> Optional[Any]:
         """Find first match"""
+        statement = _select_statement(model, _filter_shape(kwargs))
         with self.session() as session:
-            statement = select(model)
-            for key, value in kwargs.items():
-                statement = statement.where(getattr(model, key) == value)
-            return session.exec(statement).first()
+            return session.exec(statement, params=_query_params(kwargs)).first()
     
     # Alias
     first = find_by
     
     def find_many(self, model: type, **kwargs) -> List[Any]:
         """Find all matches"""
+        statement = _select_statement(model, _filter_shape(kwargs))
         with self.session() as session:
-            statement = select(model)
-            for key, value in kwargs.items():
-                statement = statement.where(getattr(model, key) == value)
-            return session.exec(statement).all()
+            return session.exec(statement, params=_query_params(kwargs)).all()
     
     # Alias
     filter = find_many
@@ -239,13 +537,15 @@ class Database:
     
     def count(self, model: type, **kwargs) -> int:
         """Count records"""
-        if kwargs:
-            return len(self.find_many(model, **kwargs))
-        return len(self.find_all(model))
+        statement = _count_statement(model, _filter_shape(kwargs))
+        with self.session() as session:
+            return session.scalar(statement, _query_params(kwargs))
     
     def exists(self, model: type, **kwargs) -> bool:
         """Check if record exists"""
-        return self.find_by(model, **kwargs) is not None
+        statement = _exists_statement(model, _filter_shape(kwargs))
+        with self.session() as session:
+            return bool(session.scalar(statement, _query_params(kwargs)))
     
     # =========================================================================
     # Advanced Queries
@@ -283,17 +583,8 @@ class Database:
             # Multiple relations:
             users = db.with_relations(User, "posts", "comments", "profile")
         """
-        from sqlalchemy.orm import selectinload, joinedload
-        
+        statement = _select_statement(model, (), relations=tuple(relations))
         with self.session() as session:
-            statement = select(model)
-            
-            for relation in relations:
-                # Use selectinload for collections, joinedload for single
-                rel_attr = getattr(model, relation, None)
-                if rel_attr:
-                    statement = statement.options(selectinload(rel_attr))
-            
             return session.exec(statement).all()
     
     def eager(self, model: type) -> "EagerQueryBuilder":
@@ -392,33 +683,19 @@ class EagerQueryBuilder:
     
     def all(self) -> List[Any]:
         """Execute query with eager loading"""
-        from sqlalchemy.orm import selectinload
+        statement = _select_statement(
+            self.model,
+            _filter_shape(self._filters),
+            self._order,
+            self._order_desc,
+            bool(self._limit_val),
+            bool(self._offset_val),
+            tuple(self._relations)
+        )
+        params = _query_params(self._filters, self._limit_val, self._offset_val)
         
         with self.db.session() as session:
-            statement = select(self.model)
-            
-            # Eager load relations
-            for relation in self._relations:
-                rel_attr = getattr(self.model, relation, None)
-                if rel_attr:
-                    statement = statement.options(selectinload(rel_attr))
-            
-            # Apply filters
-            for key, value in self._filters.items():
-                statement = statement.where(getattr(self.model, key) == value)
-            
-            # Order
-            if self._order:
-                col = getattr(self.model, self._order)
-                statement = statement.order_by(col.desc() if self._order_desc else col)
-            
-            # Limit/Offset
-            if self._limit_val:
-                statement = statement.limit(self._limit_val)
-            if self._offset_val:
-                statement = statement.offset(self._offset_val)
-            
-            return session.exec(statement).all()
+            return session.exec(statement, params=params).all()
     
     def first(self) -> Optional[Any]:
         """Get first result"""
@@ -426,6 +703,10 @@ class EagerQueryBuilder:
         return results[0] if results else None
 
 
+# Migration module filenames: any *.py except the package __init__.py
+_MIGRATION_FILE = re.compile(r"^(?!__init__\.py$)(.+)\.py$")
+
+
 class Migrator:
     """
     Database Migration System.
@@ -446,8 +727,13 @@ class Migrator:
     MIGRATIONS_DIR = "migrations"
     MIGRATIONS_TABLE = "_pyx_migrations"
     
+    # Engines whose migrations table is known to exist (DDL runs once per engine)
+    _ready_engines: "weakref.WeakSet" = weakref.WeakSet()
+    
     def __init__(self, db: "Database"):
         self.db = db
+        self._applied: Optional[List[str]] = None
+        self._pending: List[str] = []
         self._ensure_migrations_dir()
         self._ensure_migrations_table()
     
@@ -464,16 +750,28 @@ class Migrator:
         """Create migrations tracking table"""
         if not self.db.engine:
             self.db.connect()
+        if self.db.engine in Migrator._ready_engines:
+            return
         
-        with self.db.session() as session:
-            session.exec(f"""
+        with self.db.engine.begin() as conn:
+            conn.execute(text(f"""
                 CREATE TABLE IF NOT EXISTS {self.MIGRATIONS_TABLE} (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     name VARCHAR(255) NOT NULL,
                     applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
-            """)
-            session.commit()
+            """))
+        Migrator._ready_engines.add(self.db.engine)
+    
+    @cached_property
+    def _migration_names(self) -> List[str]:
+        """Sorted migration names (filenames without .py), scanned once per Migrator"""
+        import os
+        with os.scandir(self.MIGRATIONS_DIR) as entries:
+            return sorted(
+                m.group(1) for e in entries
+                if (m := _MIGRATION_FILE.match(e.name)) and e.is_file()
+            )
     
     def create(self, name: str):
         """Create a new migration file"""
@@ -512,42 +810,41 @@ def down():
         
         with open(filepath, "w") as f:
             f.write(template)
+        self.__dict__.pop("_migration_names", None)
         
         print(f"[PyX Migration] Created: {filepath}")
         return filepath
     
     def up(self):
         """Apply pending migrations"""
-        import os
         import importlib.util
         
-        applied = self._get_applied()
+        applied = set(self._get_applied())
+        migrations = self._migration_names
         
-        migrations = sorted([
-            f for f in os.listdir(self.MIGRATIONS_DIR)
-            if f.endswith(".py") and f != "__init__.py"
-        ])
-        
-        for migration in migrations:
-            name = migration[:-3]  # Remove .py
-            if name not in applied:
-                print(f"[PyX Migration] Applying: {name}")
-                
-                # Load and run migration
-                spec = importlib.util.spec_from_file_location(
-                    name, f"{self.MIGRATIONS_DIR}/{migration}"
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                if hasattr(module, "up"):
-                    module.up()
-                
-                # Record migration
-                self._record_migration(name)
-                print(f"[PyX Migration] Applied: {name}")
-        
-        if not any(m[:-3] not in applied for m in migrations):
+        try:
+            for name in migrations:
+                if name not in applied:
+                    print(f"[PyX Migration] Applying: {name}")
+                    
+                    # Load and run migration
+                    spec = importlib.util.spec_from_file_location(
+                        name, f"{self.MIGRATIONS_DIR}/{name}.py"
+                    )
+                    module = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+                    
+                    if hasattr(module, "up"):
+                        module.up()
+                    
+                    # Record migration (written in one batch below)
+                    self._record_migration(name)
+                    print(f"[PyX Migration] Applied: {name}")
+        finally:
+            # Record whatever ran, even if a later migration failed
+            self._flush_migrations()
+        
+        if not any(m not in applied for m in migrations):
             print("[PyX Migration] Nothing to migrate.")
     
     def down(self):
@@ -560,19 +857,15 @@ def down():
             return
         
         last = applied[-1]
-        migration_file = None
-        
-        import os
-        for f in os.listdir(self.MIGRATIONS_DIR):
-            if f.startswith(last) or f[:-3] == last:
-                migration_file = f
-                break
+        migration_name = next(
+            (m for m in self._migration_names if m.startswith(last)), None
+        )
         
-        if migration_file:
+        if migration_name:
             print(f"[PyX Migration] Rolling back: {last}")
             
             spec = importlib.util.spec_from_file_location(
-                last, f"{self.MIGRATIONS_DIR}/{migration_file}"
+                last, f"{self.MIGRATIONS_DIR}/{migration_name}.py"
             )
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
@@ -585,14 +878,8 @@ def down():
     
     def status(self) -> List[dict]:
         """Get migration status"""
-        import os
-        
         applied = set(self._get_applied())
-        
-        migrations = sorted([
-            f[:-3] for f in os.listdir(self.MIGRATIONS_DIR)
-            if f.endswith(".py") and f != "__init__.py"
-        ])
+        migrations = self._migration_names
         
         result = []
         for m in migrations:
@@ -604,33 +891,45 @@ def down():
         return result
     
     def _get_applied(self) -> List[str]:
-        """Get list of applied migrations"""
-        try:
-            with self.db.session() as session:
-                result = session.exec(
-                    f"SELECT name FROM {self.MIGRATIONS_TABLE} ORDER BY id"
-                )
-                return [r[0] for r in result.all()]
-        except:
-            return []
+        """Get list of applied migrations (cached per Migrator)"""
+        if self._applied is None:
+            try:
+                with self.db.session() as session:
+                    self._applied = list(session.scalars(
+                        text(f"SELECT name FROM {self.MIGRATIONS_TABLE} ORDER BY id")
+                    ))
+            except:
+                return []
+        return self._applied
     
     def _record_migration(self, name: str):
-        """Record migration as applied"""
+        """Queue migration as applied (see _flush_migrations)"""
+        self._pending.append(name)
+    
+    def _flush_migrations(self):
+        """Record all queued migrations in one INSERT and one commit"""
+        if not self._pending:
+            return
         with self.db.session() as session:
-            session.exec(
-                f"INSERT INTO {self.MIGRATIONS_TABLE} (name) VALUES (:name)",
-                {"name": name}
+            session.execute(
+                text(f"INSERT INTO {self.MIGRATIONS_TABLE} (name) VALUES (:name)"),
+                [{"name": name} for name in self._pending]
             )
             session.commit()
+        if self._applied is not None:
+            self._applied.extend(self._pending)
+        self._pending = []
     
     def _remove_migration(self, name: str):
         """Remove migration record"""
         with self.db.session() as session:
-            session.exec(
-                f"DELETE FROM {self.MIGRATIONS_TABLE} WHERE name = :name",
+            session.execute(
+                text(f"DELETE FROM {self.MIGRATIONS_TABLE} WHERE name = :name"),
                 {"name": name}
             )
             session.commit()
+        if self._applied is not None and name in self._applied:
+            self._applied.remove(name)
 
 
 class QueryBuilder:
@@ -678,25 +977,18 @@ class QueryBuilder:
     
     def all(self) -> List[Any]:
         """Execute and return all results"""
+        statement = _select_statement(
+            self.model,
+            _filter_shape(self._filters),
+            self._order,
+            self._order_desc,
+            bool(self._limit_val),
+            bool(self._offset_val)
+        )
+        params = _query_params(self._filters, self._limit_val, self._offset_val)
+        
         with self.db.session() as session:
-            statement = select(self.model)
-            
-            # Apply filters
-            for key, value in self._filters.items():
-                statement = statement.where(getattr(self.model, key) == value)
-            
-            # Apply order
-            if self._order:
-                col = getattr(self.model, self._order)
-                statement = statement.order_by(col.desc() if self._order_desc else col)
-            
-            # Apply limit/offset
-            if self._limit_val:
-                statement = statement.limit(self._limit_val)
-            if self._offset_val:
-                statement = statement.offset(self._offset_val)
-            
-            return session.exec(statement).all()
+            return session.exec(statement, params=params).all()
     
     def first(self) -> Optional[Any]:
         """Get first result"""
@@ -705,11 +997,28 @@ class QueryBuilder:
     
     def count(self) -> int:
         """Count results"""
-        return len(self.all())
+        statement = _count_statement(
+            self.model,
+            _filter_shape(self._filters),
+            bool(self._limit_val),
+            bool(self._offset_val)
+        )
+        params = _query_params(self._filters, self._limit_val, self._offset_val)
+        
+        with self.db.session() as session:
+            return session.scalar(statement, params)
     
     def exists(self) -> bool:
         """Check if any results exist"""
-        return self.first() is not None
+        statement = _exists_statement(
+            self.model,
+            _filter_shape(self._filters),
+            bool(self._offset_val)
+        )
+        params = _query_params(self._filters, offset=self._offset_val)
+        
+        with self.db.session() as session:
+            return bool(session.scalar(statement, params))
 
 
 class ZenDatabase(Database):
@@ -3,6 +3,10 @@ from pyx.ui import UI
 from pyx.client import JS
 from pyx.database import db
 from sqlmodel import select
+from sqlalchemy import func, inspect, or_
+from sqlalchemy.orm import selectinload
+from typing import Optional, get_args
+from urllib.parse import quote
 
 class AdminView:
     def __init__(self, model):
@@ -10,16 +14,46 @@ class AdminView:
         self.model_name = model.__name__
         self.slug = self.model_name.lower() + "s" # e.g. users
         self.prefix = f"/admin/{self.slug}"
+        
+        # Field layout is fixed per model; compute it once, not per request
+        self._form_fields = tuple((n, info) for n, info in model.__fields__.items() if n != "id")
+        self._headers = tuple(n for n, _ in self._form_fields)
+        self._labels = {n: n.capitalize() for n in self._headers}
+        self._search_fields = tuple(
+            n for n, info in self._form_fields
+            if info.annotation is str or str in get_args(info.annotation)
+        )
+        # Eager-load every relationship so rendering rows doesn't lazy-load per row
+        self._relations = tuple(inspect(model).relationships.keys())
+        self._loaders = tuple(selectinload(getattr(model, r)) for r in self._relations)
+
+    def _search_clause(self, q: Optional[str]):
+        """OR of case-insensitive LIKE matches over the model's string fields"""
+        if not q or not self._search_fields:
+            return None
+        pattern = f"%{q}%"
+        return or_(*[getattr(self.model, f).ilike(pattern) for f in self._search_fields])
 
-    def render_list(self):
-        """Render the List View (Data Table)"""
+    def render_list(self, page: int = 0, page_size: int = 50, q: Optional[str] = None):
+        """Render the List View (Data Table), one page at a time"""
         with db.get_session() as session:
-            # TODO: Pagination & Search logic
             statement = select(self.model)
+            if self._loaders:
+                statement = statement.options(*self._loaders)
+            count = select(func.count()).select_from(self.model)
+            search = self._search_clause(q)
+            if search is not None:
+                statement = statement.where(search)
+                count = count.where(search)
+            
+            # Clamp to the existing pages so out-of-range ?page= shows the last one
+            total = session.scalar(count)
+            page = min(max(page, 0), max(total - 1, 0) // page_size)
+            statement = statement.limit(page_size).offset(page * page_size)
             results = session.exec(statement).all()
             
             # Auto-detect headers from model fields
-            headers = [f for f in self.model.__fields__ if f != "id"]
+            headers = list(self._headers)
             
             # Row Actions
             def actions(row):
@@ -38,9 +72,26 @@ class AdminView:
                     PyxUI.CardContent([
                         PyxUI.Table(headers, results, actions=actions)
                     ], className="p-0")
-                ])
+                ]),
+                
+                self._render_pager(page, page_size, total, q)
             ], className="container mx-auto py-10")
 
+    def _render_pager(self, page: int, page_size: int, total: int, q: Optional[str] = None):
+        """Prev/Next controls for render_list"""
+        query = f"&q={quote(q)}" if q else ""
+        start = page * page_size
+        end = min(start + page_size, total)
+        return UI.div([
+            UI.span(f"{start + 1 if total else 0}-{end} of {total}", className="text-sm text-muted-foreground"),
+            UI.div([
+                PyxUI.Button("Previous", variant="ghost", size="sm", disabled=page == 0,
+                             onClick=JS.navigate(f"{self.prefix}?page={page - 1}{query}")),
+                PyxUI.Button("Next", variant="ghost", size="sm", className="ml-2", disabled=end >= total,
+                             onClick=JS.navigate(f"{self.prefix}?page={page + 1}{query}"))
+            ])
+        ], className="flex items-center justify-between mt-4")
+
     def render_form(self, id=None):
         """Render Create/Edit Form"""
         is_edit = id is not None
@@ -48,11 +99,9 @@ class AdminView:
         
         fields = []
         # Auto-generate fields
-        for field_name, field_info in self.model.__fields__.items():
-            if field_name == "id": continue
-            
+        for field_name, field_info in self._form_fields:
             fields.append(UI.div([
-                UI.label(field_name.capitalize(), className="text-sm font-medium leading-none peer-disabled:cursor-not-allowed peer-disabled:opacity-70 mb-2 block"),
+                UI.label(self._labels[field_name], className="text-sm font-medium leading-none peer-disabled:cursor-not-allowed peer-disabled:opacity-70 mb-2 block"),
                 PyxUI.Input(name=field_name, placeholder=f"Enter {field_name}")
             ], className="mb-4"))
 
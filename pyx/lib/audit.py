@@ -1,11 +1,25 @@
 """
 PyX Audit Logging System
 Enterprise-grade activity tracking.
+
+Logs to the "pyx.audit" logger; per-entry events are DEBUG, e.g.
+logging.getLogger("pyx.audit").setLevel(logging.DEBUG) to see them.
 """
 from datetime import datetime
 from typing import Optional, Dict, Any
-from ..data.database import Model, Column, db
+from sqlalchemy import func
+from ..data.database import Model, Column, Field, db
+from ..core.serialize import dumps as _dumps
+import atexit
 import json
+import logging
+import queue
+import reprlib
+import threading
+
+logger = logging.getLogger("pyx.audit")
+
+_EMPTY_JSON = "{}"
 
 # ==========================================
 # MODELS
@@ -25,7 +39,8 @@ class AuditLog(Model, table=True):
     target_id: Optional[str] = None # e.g. "101"
     details: str = Column(default="{}") # JSON blob for extra context
     ip_address: Optional[str] = None
-    created_at: datetime = Column(default=datetime.now())
+    # Evaluated per row (was once at import); server default covers raw SQL inserts
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
 
     @property
     def meta(self) -> Dict[str, Any]:
@@ -35,16 +50,69 @@ class AuditLog(Model, table=True):
         except:
             return {}
 
+# ==========================================
+# BACKGROUND WRITER
+# ==========================================
+
+AUDIT_QUEUE_SIZE = 10_000   # Entries buffered before new ones are dropped
+AUDIT_BATCH_SIZE = 500      # Max rows per INSERT
+AUDIT_FLUSH_INTERVAL = 0.2  # Seconds to wait for a batch to fill
+
+_audit_queue: "queue.Queue[dict]" = queue.Queue(maxsize=AUDIT_QUEUE_SIZE)
+_audit_worker: Optional[threading.Thread] = None
+_audit_lock = threading.Lock()
+
+
+def _write_batch(batch: list):
+    try:
+        db.bulk_save_mappings(AuditLog, batch)
+    except Exception as e:
+        logger.error("Failed to save %d log(s): %s", len(batch), e)
+
+
+def _audit_loop():
+    """Drain the queue, writing up to AUDIT_BATCH_SIZE entries per INSERT"""
+    while True:
+        batch = [_audit_queue.get()]
+        try:
+            while len(batch) < AUDIT_BATCH_SIZE:
+                batch.append(_audit_queue.get(timeout=AUDIT_FLUSH_INTERVAL))
+        except queue.Empty:
+            pass
+        _write_batch(batch)
+        for _ in batch:
+            _audit_queue.task_done()
+
+
+def _ensure_worker():
+    global _audit_worker
+    if _audit_worker is None:
+        with _audit_lock:
+            if _audit_worker is None:
+                _audit_worker = threading.Thread(target=_audit_loop, name="pyx-audit", daemon=True)
+                _audit_worker.start()
+                atexit.register(Audit.flush)
+
 # ==========================================
 # ENGINE
 # ==========================================
 
 class Audit:
+    # Whether @track_activity stores (truncated) call arguments in details
+    RECORD_DETAILS = False
+    
+    @classmethod
+    def records_details(cls) -> bool:
+        return cls.RECORD_DETAILS
+    
     @staticmethod
     def log(action: str, target: Any = None, details: dict = None, user = None):
         """
         Log an activity.
         
+        The entry is queued and written by a background worker in batches;
+        call Audit.flush() to wait for pending writes.
+        
         Args:
             action: String identifier (e.g. "login.success")
             target: The object being acted upon (optional)
@@ -68,21 +136,30 @@ class Audit:
             if hasattr(target, 'id'):
                 target_id = str(target.id)
                 
-        # Create Log
-        log_entry = AuditLog(
-            user_id=user_id,
-            user_email=user_email,
-            action=action,
-            target_type=target_type,
-            target_id=target_id,
-            details=json.dumps(details or {})
-        )
+        # Plain row for a Core INSERT; skips AuditLog validation per event
+        row = {
+            "user_id": user_id,
+            "user_email": user_email,
+            "action": action,
+            "target_type": target_type,
+            "target_id": target_id,
+            "details": _dumps(details) if details else _EMPTY_JSON,
+            "ip_address": None,
+        }
         
+        # Written in batches by the background worker
+        _ensure_worker()
         try:
-            db.save(log_entry)
-            print(f"📝 [Audit] {action} by {user_email}")
-        except Exception as e:
-            print(f"⚠️ [Audit] Failed to save log: {e}")
+            _audit_queue.put_nowait(row)
+            logger.debug("%s by %s", action, user_email)
+        except queue.Full:
+            logger.warning("Queue full, dropped log: %s", action)
+    
+    @staticmethod
+    def flush():
+        """Block until every queued log has been written"""
+        if _audit_worker is not None:
+            _audit_queue.join()
 
 # ==========================================
 # DECORATOR
@@ -90,10 +167,23 @@ class Audit:
 
 from functools import wraps
 
+# Caps each logged repr so large arguments (models, payloads) stay cheap
+_repr = reprlib.Repr()
+_repr.maxstring = 128
+_repr.maxother = 128
+_REPR_LIMIT = 256
+
+
+def _fast_repr(value: Any) -> str:
+    text = _repr.repr(value)
+    return text if len(text) <= _REPR_LIMIT else text[:_REPR_LIMIT - 3] + "..."
+
 def track_activity(action: str):
     """
     Decorator to automatically log controller actions.
     
+    Call arguments are only captured when Audit.RECORD_DETAILS is set.
+    
     Usage:
         @track_activity("product.delete")
         def delete_product(id):
@@ -111,7 +201,11 @@ def track_activity(action: str):
             if args:
                 target = args[0] # Naive guess
                 
-            Audit.log(action, target=target, details={"args": str(args), "kwargs": str(kwargs)})
+            if Audit.records_details():
+                details = {"args": _fast_repr(args), "kwargs": _fast_repr(kwargs)}
+            else:
+                details = None
+            Audit.log(action, target=target, details=details)
             
             return result
         return wrapper
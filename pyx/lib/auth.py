@@ -2,17 +2,145 @@
 PyX Auth System
 Built-in authentication with Users, Sessions, and Roles.
 """
+import base64
+import hashlib
+import hmac
+import re
 import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Optional, List
+from functools import cached_property
+from typing import Optional, List, Tuple
+from sqlalchemy import delete as sa_delete, func, select
 from ..data.database import Model, Column, db
 from ..core.security import security, PasswordHasher, AccountLockout
 
 
+# ==========================================
+# PASSWORD VERIFY CACHE
+# ==========================================
+
+# Remembers recent bcrypt outcomes so repeated logins skip the key schedule.
+# Keys are HMAC(pepper, password|hash) with a per-process random pepper, so
+# neither plaintext nor a reusable digest is kept; the cache does not survive
+# restarts. A changed password yields a new hash and therefore a new key.
+VERIFY_CACHE_SIZE = 1024
+VERIFY_CACHE_TTL = 300.0      # Seconds a successful verify is remembered
+VERIFY_CACHE_FAIL_TTL = 30.0  # Short, so AccountLockout still sees retries
+
+_verify_pepper = secrets.token_bytes(32)
+_verify_cache: "OrderedDict[bytes, Tuple[bool, float]]" = OrderedDict()
+_verify_lock = threading.Lock()
+
+
+def _verify_key(password: str, password_hash: str) -> bytes:
+    message = password.encode() + b"|" + password_hash.encode()
+    return hmac.new(_verify_pepper, message, hashlib.sha256).digest()
+
+
+def _verify_cached(password: str, password_hash: str) -> bool:
+    """security.verify_password with a bounded TTL memo in front of it"""
+    key = _verify_key(password, password_hash)
+    now = time.monotonic()
+    with _verify_lock:
+        hit = _verify_cache.get(key)
+        if hit is not None:
+            if hit[1] > now:
+                _verify_cache.move_to_end(key)
+                return hit[0]
+            del _verify_cache[key]
+    
+    ok = security.verify_password(password, password_hash)
+    ttl = VERIFY_CACHE_TTL if ok else VERIFY_CACHE_FAIL_TTL
+    with _verify_lock:
+        _verify_cache[key] = (ok, now + ttl)
+        while len(_verify_cache) > VERIFY_CACHE_SIZE:
+            _verify_cache.popitem(last=False)
+    return ok
+
+
+# ==========================================
+# SESSION CACHE
+# ==========================================
+
+# token hash -> (user, monotonic expiry). Saves the Session + User lookups on every
+# authenticated request. Entries live at most SESSION_CACHE_TTL so role or
+# is_active changes made by another process are picked up; this process
+# invalidates them on logout, update_user and delete_user.
+SESSION_CACHE_SIZE = 10_000
+SESSION_CACHE_TTL = 60.0
+
+_session_cache: "OrderedDict[str, Tuple[User, float]]" = OrderedDict()
+_session_lock = threading.Lock()
+
+
+# 43 base64url chars; the last one carries 4 data bits + 2 zero padding bits
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_-]{42}[AEIMQUYcgkosw048]")
+
+
+def _new_token() -> Tuple[str, bytes]:
+    """New session token (43-char base64url of 32 random bytes) and its hash"""
+    raw = secrets.token_bytes(32)
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii"), hashlib.sha256(raw).digest()
+
+
+def _token_hash(token: str) -> Optional[bytes]:
+    """
+    Fixed-length lookup key for a session token: SHA-256 of its 32 raw bytes.
+    
+    Lookups by digest don't depend on token content, and a leaked
+    sessions table doesn't hand out usable tokens. Malformed tokens give None.
+    """
+    if not isinstance(token, str) or _TOKEN_RE.fullmatch(token) is None:
+        return None
+    return hashlib.sha256(base64.urlsafe_b64decode(token + "=")).digest()
+
+
+def _cache_session(token_hash: bytes, user: "User", expires_at: datetime):
+    ttl = min(SESSION_CACHE_TTL, (expires_at - datetime.now()).total_seconds())
+    if ttl <= 0:
+        return
+    with _session_lock:
+        _session_cache[token_hash] = (user, time.monotonic() + ttl)
+        _session_cache.move_to_end(token_hash)
+        while len(_session_cache) > SESSION_CACHE_SIZE:
+            _session_cache.popitem(last=False)
+
+
+def _cached_session_user(token_hash: bytes) -> Optional["User"]:
+    with _session_lock:
+        hit = _session_cache.get(token_hash)
+        if hit is None:
+            return None
+        if hit[1] <= time.monotonic():
+            del _session_cache[token_hash]
+            return None
+        _session_cache.move_to_end(token_hash)
+        return hit[0]
+
+
+def _uncache_user(user_id: int):
+    with _session_lock:
+        for key in [k for k, (u, _) in _session_cache.items() if u.id == user_id]:
+            del _session_cache[key]
+
+
 # ==========================================
 # MODELS
 # ==========================================
 
+# Default Hardcoded Roles for now (Zen Mode)
+_ROLE_PERMS = {
+    "admin": frozenset({"*"}),
+    "editor": frozenset({"view", "create", "update"}),
+    "user": frozenset({"view"}),
+}
+_NO_PERMS = frozenset()
+
+
 class User(Model, table=True):
     """
     Built-in User model for authentication.
@@ -23,30 +151,23 @@ class User(Model, table=True):
     email: str = Column(unique=True, index=True)
     password_hash: str
     full_name: str = Column(default="User")
-    role: str = Column(default="user")  # user, admin, editor
+    role: str = Column(default="user", index=True)  # user, admin, editor
     is_active: bool = True
-    created_at: datetime = Column(default=datetime.now())
+    created_at: datetime = Column(default=datetime.utcnow)
     last_login: Optional[datetime] = None
     
-    @property
+    @cached_property
     def permissions(self) -> List[str]:
         """
         Get permissions based on role. 
         In the future, this can load from a Roles table.
         """
-        # Default Hardcoded Roles for now (Zen Mode)
-        ROLES = {
-            "admin": ["*"],
-            "editor": ["view", "create", "update"],
-            "user": ["view"]
-        }
-        return ROLES.get(self.role, [])
+        return sorted(_ROLE_PERMS.get(self.role, _NO_PERMS))
 
     def can(self, permission: str) -> bool:
         """Check if user has specific permission"""
-        perms = self.permissions
-        if "*" in perms: return True
-        return permission in perms
+        perms = _ROLE_PERMS.get(self.role, _NO_PERMS)
+        return "*" in perms or permission in perms
 
     def set_password(self, password: str):
         """Hash and set password"""
@@ -56,6 +177,11 @@ class User(Model, table=True):
         """Verify password"""
         return Auth.verify_password(password, self.password_hash)
     
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "role":
+            self.__dict__.pop("permissions", None)  # Recompute from the new role
+    
     def __repr__(self):
         return f"<User {self.email} ({self.role})>"
 
@@ -68,13 +194,41 @@ class Session(Model, table=True):
     
     id: Optional[int] = Column(primary_key=True)
     user_id: int
-    token: str = Column(unique=True, index=True)
+    token_hash: bytes = Column(unique=True, index=True)  # SHA-256 of the token bytes; raw token is never stored
     expires_at: datetime
-    created_at: datetime = Column(default=datetime.now())
+    expires_at_epoch: Optional[int] = Column(default=None, index=True)  # Unix seconds, same instant as expires_at
+    created_at: datetime = Column(default=datetime.utcnow)
     
     @property
     def is_valid(self) -> bool:
-        return datetime.now() < self.expires_at
+        if self.expires_at_epoch is not None:
+            return time.time() < self.expires_at_epoch
+        return datetime.now() < self.expires_at  # Sessions created before expires_at_epoch
+
+
+# ==========================================
+# REQUEST CONTEXT
+# ==========================================
+
+# Per request/task, so concurrent users never see each other's login
+_current_user_var: ContextVar[Optional[User]] = ContextVar("_current_user", default=None)
+_current_session_var: ContextVar[Optional[Session]] = ContextVar("_current_session", default=None)
+# Session token sent with the current request (set by AuthMiddleware)
+_request_token_var: ContextVar[Optional[str]] = ContextVar("_request_token", default=None)
+# Request token not looked up yet; resolved on the first current_user() call
+_pending_token_var: ContextVar[Optional[str]] = ContextVar("_pending_token", default=None)
+
+
+def _resolve_current_user() -> Optional[User]:
+    """Current user, loading it from the pending request token on first use"""
+    user = _current_user_var.get()
+    if user is None:
+        token = _pending_token_var.get()
+        if token:
+            _pending_token_var.set(None)
+            user = Auth.get_user(token)
+            _current_user_var.set(user)
+    return user
 
 
 # ==========================================
@@ -104,9 +258,6 @@ class Auth:
         auth.logout(session_token)
     """
     
-    _current_session: Optional[Session] = None
-    _current_user: Optional[User] = None
-    
     # ==========================================
     # PASSWORD UTILITIES
     # ==========================================
@@ -121,8 +272,8 @@ class Auth:
     
     @staticmethod
     def verify_password(password: str, password_hash: str) -> bool:
-        """Verify password against hash"""
-        return security.verify_password(password, password_hash)
+        """Verify password against hash (recent results are memoized per process)"""
+        return _verify_cached(password, password_hash)
     
     @staticmethod
     def check_password_strength(password: str) -> dict:
@@ -198,13 +349,15 @@ class Auth:
             return None
         
         # Create session
-        token = secrets.token_urlsafe(32)
+        token, token_hash = _new_token()
         expires_in = timedelta(days=30) if remember else timedelta(hours=24)
+        expires_at = datetime.now() + expires_in
         
         session = Session(
             user_id=user.id,
-            token=token,
-            expires_at=datetime.now() + expires_in
+            token_hash=token_hash,
+            expires_at=expires_at,
+            expires_at_epoch=int(expires_at.timestamp())
         )
         db.save(session)
         
@@ -212,9 +365,9 @@ class Auth:
         user.last_login = datetime.now()
         db.save(user)
         
-        # Store in memory
-        Auth._current_session = session
-        Auth._current_user = user
+        # Store in the current request context
+        _current_session_var.set(session)
+        _current_user_var.set(user)
         
         print(f"[PyX Auth] Login success: {email}")
         return token
@@ -227,20 +380,48 @@ class Auth:
         Args:
             token: Session token (optional, uses current session if not provided)
         """
-        if token:
-            session = db.find_by(Session, token=token)
-        else:
-            session = Auth._current_session
+        session = None if token else _current_session_var.get()
+        if session is None:
+            # Fall back to the token this request came in with
+            token = token or _request_token_var.get()
+            token_hash = _token_hash(token) if token else None
+            session = db.find_by(Session, token_hash=token_hash) if token_hash else None
         
         if session:
+            with _session_lock:
+                _session_cache.pop(session.token_hash, None)
             db.delete(session)
-            Auth._current_session = None
-            Auth._current_user = None
+            _current_session_var.set(None)
+            _current_user_var.set(None)
+            _pending_token_var.set(None)
+            if _request_token_var.get() == token:
+                _request_token_var.set(None)
             print("[PyX Auth] Logout success")
             return True
         
         return False
     
+    @staticmethod
+    def logout_all(user: User) -> int:
+        """End every session of a user. Returns the number of sessions removed."""
+        _uncache_user(user.id)
+        return db.delete_many(Session, user_id=user.id)
+    
+    @staticmethod
+    def purge_expired_sessions() -> int:
+        """
+        Delete all expired sessions in one statement. Call periodically.
+        
+        Usage:
+            @periodic(3600)
+            def cleanup():
+                auth.purge_expired_sessions()
+        """
+        with db.session() as session:
+            result = session.execute(sa_delete(Session).where(Session.expires_at < datetime.now()))
+            session.commit()
+            return result.rowcount
+    
     @staticmethod
     def get_user(token: str) -> Optional[User]:
         """
@@ -252,26 +433,36 @@ class Auth:
         Returns:
             User object if valid session, None otherwise.
         """
-        session = db.find_by(Session, token=token)
+        token_hash = _token_hash(token)
+        if token_hash is None:
+            return None
+        user = _cached_session_user(token_hash)
+        if user is not None:
+            return user
+        
+        session = db.find_by(Session, token_hash=token_hash)
         
-        if not session:
+        if not session or not hmac.compare_digest(session.token_hash, token_hash):
             return None
         
         if not session.is_valid:
             db.delete(session)  # Clean up expired session
             return None
         
-        return db.find_by_id(User, session.user_id)
+        user = db.find_by_id(User, session.user_id)
+        if user is not None:
+            _cache_session(token_hash, user, session.expires_at)
+        return user
     
     @staticmethod
     def current_user() -> Optional[User]:
-        """Get currently logged in user (from memory)"""
-        return Auth._current_user
+        """Get currently logged in user (for the current request context)"""
+        return _resolve_current_user()
     
     @staticmethod
     def is_authenticated() -> bool:
         """Check if user is logged in"""
-        return Auth._current_user is not None
+        return _resolve_current_user() is not None
     
     @staticmethod
     def require_auth(func):
@@ -321,9 +512,26 @@ class Auth:
     
     @staticmethod
     def get_all_users() -> List[User]:
-        """Get all users"""
+        """Get all users (loads the whole table; meant for admin/debug use)"""
         return db.find_all(User)
     
+    @staticmethod
+    def get_users_by_role(role: str) -> List[User]:
+        """Find users with a role, filtered in SQL"""
+        return db.find_many(User, role=role)
+    
+    @staticmethod
+    def count_users(**filters) -> int:
+        """Count users matching filters with SELECT COUNT(*), e.g. count_users(is_active=True)"""
+        return db.count(User, **filters)
+    
+    @staticmethod
+    def count_by_role() -> dict:
+        """Number of users per role, e.g. {"admin": 2, "user": 140}"""
+        with db.session() as session:
+            rows = session.execute(select(User.role, func.count()).group_by(User.role))
+            return dict(rows.all())
+    
     @staticmethod
     def get_user_by_email(email: str) -> Optional[User]:
         """Find user by email"""
@@ -337,15 +545,14 @@ class Auth:
     @staticmethod
     def update_user(user: User) -> User:
         """Update user data"""
+        _uncache_user(user.id)
         return db.save(user)
     
     @staticmethod
     def delete_user(user: User) -> None:
         """Delete user and their sessions"""
         # Delete all user sessions first
-        sessions = db.find_many(Session, user_id=user.id)
-        for session in sessions:
-            db.delete(session)
+        Auth.logout_all(user)
         db.delete(user)
         print(f"[PyX Auth] User deleted: {user.email}")
 
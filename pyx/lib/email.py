@@ -2,15 +2,83 @@
 PyX Email Service
 Simple email sending with SMTP support.
 """
+import asyncio
+import base64
+import mmap
+import re
+from functools import lru_cache
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email import encoders
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 import os
 
 
+# {{name}} placeholders for send_template, matched in a single pass
+_TEMPLATE_VAR = re.compile(r"\{\{\s*([^{}\s]+)\s*\}\}")
+
+
+@lru_cache(maxsize=128)
+def _compile_template(template: str) -> tuple:
+    """
+    Split a template once into alternating (literal, name, placeholder) parts.
+    
+    Rendering a compiled template is a single join, with no regex scan per send.
+    """
+    parts = []
+    pos = 0
+    for m in _TEMPLATE_VAR.finditer(template):
+        parts.append((template[pos:m.start()], m.group(1), m.group(0)))
+        pos = m.end()
+    return tuple(parts), template[pos:]
+
+
+def _render_template(template: str, context: dict) -> str:
+    """Fill {{name}} placeholders; unknown placeholders are left as-is"""
+    parts, tail = _compile_template(template)
+    out = []
+    for literal, name, placeholder in parts:
+        out.append(literal)
+        out.append(str(context[name]) if name in context else placeholder)
+    out.append(tail)
+    return "".join(out)
+
+
+# Raw bytes per base64 chunk: a multiple of 57 so every chunk encodes to
+# whole 76-char lines (RFC 2045) and chunks can simply be concatenated
+_B64_CHUNK = 57 * 1024
+
+
+def _attachment_part(filepath: str) -> MIMEBase:
+    """
+    Base64-encode a file into a MIME part in one pass over an mmap.
+    
+    The file is read through the page cache in chunks, so no full raw copy
+    is held alongside the encoded payload.
+    """
+    part = MIMEBase("application", "octet-stream")
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                payload = "".join(
+                    base64.encodebytes(mm[i:i + _B64_CHUNK]).decode("ascii")
+                    for i in range(0, size, _B64_CHUNK)
+                )
+        else:
+            payload = ""
+    part.set_payload(payload)
+    part["Content-Transfer-Encoding"] = "base64"
+    part.add_header(
+        "Content-Disposition",
+        f"attachment; filename={os.path.basename(filepath)}"
+    )
+    return part
+
+
 class EmailConfig:
     """Email configuration"""
     SMTP_HOST: str = ""
@@ -70,6 +138,7 @@ class Email:
         EmailConfig.FROM_EMAIL = from_email or os.getenv("FROM_EMAIL", "")
         EmailConfig.FROM_NAME = from_name or os.getenv("FROM_NAME", "PyX App")
         EmailConfig.SMTP_USE_TLS = use_tls
+        cls.close()  # Pooled connections belong to the old settings
         
         print(f"[PyX Email] Configured: {EmailConfig.SMTP_HOST}:{EmailConfig.SMTP_PORT}")
     
@@ -101,73 +170,277 @@ class Email:
         Returns:
             dict with success status and error if any
         """
+        error = cls._check_send(to)
+        if error:
+            return {"success": False, "error": error}
+        
         try:
-            # Create message
-            msg = MIMEMultipart()
-            msg["From"] = f"{EmailConfig.FROM_NAME} <{EmailConfig.FROM_EMAIL}>"
-            msg["Subject"] = subject
-            
-            # Handle recipients
-            if isinstance(to, list):
-                msg["To"] = ", ".join(to)
-                recipients = to.copy()
-            else:
-                msg["To"] = to
-                recipients = [to]
+            msg, recipients = cls._build_message(to, subject, body, html, attachments, cc, bcc, reply_to)
+            cls._sendmail(recipients, msg.as_string())
             
-            if cc:
-                msg["Cc"] = ", ".join(cc)
-                recipients.extend(cc)
-            
-            if bcc:
-                recipients.extend(bcc)
-            
-            if reply_to:
-                msg["Reply-To"] = reply_to
+            print(f"[PyX Email] Sent to: {to}")
+            return {"success": True, "message": "Email sent successfully"}
             
-            # Add body
-            content_type = "html" if html else "plain"
+        except Exception as e:
+            print(f"[PyX Email] Error: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    @classmethod
+    def send_bulk(cls, messages: List[dict]) -> List[dict]:
+        """
+        Send several emails over one SMTP connection.
+        
+        Usage:
+            email.send_bulk([
+                {"to": "a@example.com", "subject": "Hi", "body": "..."},
+                {"to": "b@example.com", "subject": "Hi", "body": "..."},
+            ])
+        """
+        return [cls.send(**message) for message in messages]
+    
+    @staticmethod
+    def _check_send(to: Union[str, List[str]]) -> Optional[str]:
+        """Cheap pre-flight check, so misconfigured sends skip building the MIME message"""
+        if not EmailConfig.SMTP_HOST or not EmailConfig.FROM_EMAIL:
+            return "email not configured"
+        if not to:
+            return "no recipients"
+        return None
+    
+    @staticmethod
+    def _build_message(
+        to: Union[str, List[str]],
+        subject: str,
+        body: str,
+        html: bool = False,
+        attachments: List[str] = None,
+        cc: List[str] = None,
+        bcc: List[str] = None,
+        reply_to: str = None
+    ) -> Tuple[Union[MIMEText, MIMEMultipart], List[str]]:
+        """Build the MIME message and the full recipient list"""
+        content_type = "html" if html else "plain"
+        if attachments:
+            msg = MIMEMultipart()
             msg.attach(MIMEText(body, content_type))
-            
-            # Add attachments
-            if attachments:
-                for filepath in attachments:
-                    if os.path.exists(filepath):
-                        with open(filepath, "rb") as f:
-                            part = MIMEBase("application", "octet-stream")
-                            part.set_payload(f.read())
-                            encoders.encode_base64(part)
-                            filename = os.path.basename(filepath)
-                            part.add_header(
-                                "Content-Disposition",
-                                f"attachment; filename={filename}"
-                            )
-                            msg.attach(part)
-            
-            # Connect and send
-            with smtplib.SMTP(EmailConfig.SMTP_HOST, EmailConfig.SMTP_PORT) as server:
-                if EmailConfig.SMTP_USE_TLS:
-                    server.starttls()
-                
-                if EmailConfig.SMTP_USER and EmailConfig.SMTP_PASSWORD:
-                    server.login(EmailConfig.SMTP_USER, EmailConfig.SMTP_PASSWORD)
-                
-                server.sendmail(EmailConfig.FROM_EMAIL, recipients, msg.as_string())
+        else:
+            # No attachments: a single-part message needs no boundaries
+            msg = MIMEText(body, content_type)
+        msg["From"] = f"{EmailConfig.FROM_NAME} <{EmailConfig.FROM_EMAIL}>"
+        msg["Subject"] = subject
+        
+        # Handle recipients (one list for the envelope, built once)
+        to_list = to if isinstance(to, list) else [to]
+        recipients = [*to_list, *(cc or ()), *(bcc or ())]
+        msg["To"] = ", ".join(to_list)
+        if cc:
+            msg["Cc"] = ", ".join(cc)
+        
+        if reply_to:
+            msg["Reply-To"] = reply_to
+        
+        # Add attachments
+        if attachments:
+            for filepath in attachments:
+                if os.path.exists(filepath):
+                    msg.attach(_attachment_part(filepath))
+        
+        return msg, recipients
+    
+    # ==========================================
+    # CONNECTION POOL
+    # ==========================================
+    
+    # One open SMTP connection per thread, reused until idle this long
+    SMTP_IDLE_TIMEOUT = 60.0
+    
+    _pool: Dict[int, Tuple[smtplib.SMTP, float]] = {}
+    _pool_lock = threading.Lock()
+    
+    @staticmethod
+    def _connect() -> smtplib.SMTP:
+        server = smtplib.SMTP(EmailConfig.SMTP_HOST, EmailConfig.SMTP_PORT)
+        if EmailConfig.SMTP_USE_TLS:
+            server.starttls()
+        
+        if EmailConfig.SMTP_USER and EmailConfig.SMTP_PASSWORD:
+            server.login(EmailConfig.SMTP_USER, EmailConfig.SMTP_PASSWORD)
+        return server
+    
+    @classmethod
+    def _get_connection(cls) -> smtplib.SMTP:
+        """This thread's SMTP connection, reconnecting if idle too long"""
+        key = threading.get_ident()
+        now = time.monotonic()
+        with cls._pool_lock:
+            entry = cls._pool.pop(key, None)
+            # Sweep connections left idle by other (possibly finished) threads
+            stale = [k for k, (_, last_used) in cls._pool.items() if now - last_used >= cls.SMTP_IDLE_TIMEOUT]
+            idle = [cls._pool.pop(k)[0] for k in stale]
+        for server in idle:
+            cls._quit(server)
+        if entry is not None:
+            server, last_used = entry
+            if now - last_used < cls.SMTP_IDLE_TIMEOUT:
+                return server
+            cls._quit(server)
+        return cls._connect()
+    
+    @classmethod
+    def _release(cls, server: smtplib.SMTP):
+        with cls._pool_lock:
+            cls._pool[threading.get_ident()] = (server, time.monotonic())
+    
+    @staticmethod
+    def _quit(server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
+    @classmethod
+    def _sendmail(cls, recipients: List[str], message: str):
+        """Send on the pooled connection, reconnecting once if the server dropped it"""
+        server = cls._get_connection()
+        try:
+            server.sendmail(EmailConfig.FROM_EMAIL, recipients, message)
+        except smtplib.SMTPServerDisconnected:
+            server = cls._resend(server, recipients, message)
+        except smtplib.SMTPException:
+            # Message-level rejection; the connection itself is still usable
+            cls._release(server)
+            raise
+        except OSError:
+            server = cls._resend(server, recipients, message)
+        cls._release(server)
+    
+    @classmethod
+    def _resend(cls, server: smtplib.SMTP, recipients: List[str], message: str) -> smtplib.SMTP:
+        """Retry once on a fresh connection, closing it if the retry fails too"""
+        server.close()
+        server = cls._connect()
+        try:
+            server.sendmail(EmailConfig.FROM_EMAIL, recipients, message)
+        except BaseException:
+            server.close()
+            raise
+        return server
+    
+    @classmethod
+    def close(cls):
+        """Close all pooled SMTP connections (e.g. on app shutdown)"""
+        with cls._pool_lock:
+            entries = list(cls._pool.values())
+            cls._pool.clear()
+        for server, _ in entries:
+            cls._quit(server)
+    
+    # ==========================================
+    # ASYNC
+    # ==========================================
+    
+    @staticmethod
+    def _aiosmtplib():
+        try:
+            import aiosmtplib
+        except ImportError:
+            raise ImportError("aiosmtplib not installed. Run: pip install aiosmtplib")
+        return aiosmtplib
+    
+    @classmethod
+    async def _connect_async(cls):
+        aiosmtplib = cls._aiosmtplib()
+        server = aiosmtplib.SMTP(
+            hostname=EmailConfig.SMTP_HOST,
+            port=EmailConfig.SMTP_PORT,
+            start_tls=EmailConfig.SMTP_USE_TLS
+        )
+        await server.connect()
+        if EmailConfig.SMTP_USER and EmailConfig.SMTP_PASSWORD:
+            await server.login(EmailConfig.SMTP_USER, EmailConfig.SMTP_PASSWORD)
+        return server
+    
+    @classmethod
+    async def send_async(cls, to: Union[str, List[str]], subject: str, body: str, **kwargs) -> dict:
+        """
+        Send an email without blocking the event loop (requires aiosmtplib).
+        
+        Takes the same arguments as send().
+        """
+        error = cls._check_send(to)
+        if error:
+            return {"success": False, "error": error}
+        
+        try:
+            msg, recipients = cls._build_message(to, subject, body, **kwargs)
+            server = await cls._connect_async()
+            try:
+                await server.sendmail(EmailConfig.FROM_EMAIL, recipients, msg.as_string())
+            finally:
+                await server.quit()
             
             print(f"[PyX Email] Sent to: {to}")
             return {"success": True, "message": "Email sent successfully"}
             
+        except ImportError:
+            raise
         except Exception as e:
             print(f"[PyX Email] Error: {str(e)}")
             return {"success": False, "error": str(e)}
     
+    @classmethod
+    async def send_many(cls, messages: List[dict], concurrency: int = 20) -> List[dict]:
+        """
+        Send many emails concurrently (requires aiosmtplib).
+        
+        Opens up to `concurrency` SMTP connections; each one sends messages
+        back to back, so handshakes are paid once per connection.
+        Results are returned in the same order as messages.
+        
+        Usage:
+            results = await email.send_many([
+                {"to": "a@example.com", "subject": "News", "body": "..."},
+                ...
+            ], concurrency=10)
+        """
+        cls._aiosmtplib()
+        results: List[Optional[dict]] = [None] * len(messages)
+        pending = iter(enumerate(messages))
+        
+        async def worker():
+            server = None
+            try:
+                for i, message in pending:
+                    error = cls._check_send(message.get("to"))
+                    if error:
+                        results[i] = {"success": False, "error": error}
+                        continue
+                    try:
+                        msg, recipients = cls._build_message(**message)
+                        if server is None:
+                            server = await cls._connect_async()
+                        await server.sendmail(EmailConfig.FROM_EMAIL, recipients, msg.as_string())
+                        results[i] = {"success": True, "message": "Email sent successfully"}
+                    except Exception as e:
+                        print(f"[PyX Email] Error: {str(e)}")
+                        results[i] = {"success": False, "error": str(e)}
+                        if server is not None and not server.is_connected:
+                            server = None
+            finally:
+                if server is not None and server.is_connected:
+                    await server.quit()
+        
+        await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(messages))))))
+        print(f"[PyX Email] Sent {sum(r['success'] for r in results)}/{len(messages)} emails")
+        return results
+    
     @classmethod
     def send_template(
         cls,
         to: Union[str, List[str]],
         subject: str,
         template: str,
-        context: dict = {},
+        context: dict = None,
         **kwargs
     ) -> dict:
         """
@@ -187,28 +460,66 @@ class Email:
                 context={"name": "John", "code": "123456"}
             )
         """
-        # Simple template substitution
-        body = template
-        for key, value in context.items():
-            body = body.replace("{{" + key + "}}", str(value))
+        body = _render_template(template, context or {})
         
         return cls.send(to=to, subject=subject, body=body, html=True, **kwargs)
     
+    # ==========================================
+    # BUILT-IN TEMPLATES
+    # ==========================================
+    
+    _WELCOME_TMPL = """
+    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+        <h1 style="color: #3b82f6;">Welcome to {{app_name}}!</h1>
+        <p>Hi {{name}},</p>
+        <p>Thank you for signing up. We're excited to have you on board!</p>
+        <p style="margin-top: 30px;">Best regards,<br>The {{app_name}} Team</p>
+    </div>
+    """
+    
+    _RESET_TMPL = """
+    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+        <h1 style="color: #3b82f6;">Reset Your Password</h1>
+        <p>Hi {{name}},</p>
+        <p>We received a request to reset your password. Click the button below to create a new password:</p>
+        <p style="text-align: center; margin: 30px 0;">
+            <a href="{{reset_link}}" style="background: #3b82f6; color: white; padding: 12px 24px; 
+               text-decoration: none; border-radius: 6px; display: inline-block;">
+                Reset Password
+            </a>
+        </p>
+        <p style="color: #6b7280; font-size: 14px;">
+            If you didn't request this, you can safely ignore this email.
+        </p>
+        <p style="margin-top: 30px;">Best regards,<br>The {{app_name}} Team</p>
+    </div>
+    """
+    
+    _VERIFY_TMPL = """
+    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+        <h1 style="color: #3b82f6;">Verify Your Email</h1>
+        <p>Hi {{name}},</p>
+        <p>Your verification code is:</p>
+        <p style="text-align: center; margin: 30px 0;">
+            <span style="background: #f3f4f6; padding: 16px 32px; font-size: 32px; 
+                   font-weight: bold; letter-spacing: 8px; border-radius: 8px;">
+                {{code}}
+            </span>
+        </p>
+        <p style="color: #6b7280; font-size: 14px;">
+            This code will expire in 10 minutes.
+        </p>
+        <p style="margin-top: 30px;">Best regards,<br>The {{app_name}} Team</p>
+    </div>
+    """
+    
     @classmethod
     def send_welcome(cls, to: str, name: str, **kwargs) -> dict:
         """Send a welcome email (built-in template)"""
-        template = """
-        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <h1 style="color: #3b82f6;">Welcome to {{app_name}}!</h1>
-            <p>Hi {{name}},</p>
-            <p>Thank you for signing up. We're excited to have you on board!</p>
-            <p style="margin-top: 30px;">Best regards,<br>The {{app_name}} Team</p>
-        </div>
-        """
         return cls.send_template(
             to=to,
             subject=f"Welcome to {EmailConfig.FROM_NAME}!",
-            template=template,
+            template=cls._WELCOME_TMPL,
             context={"name": name, "app_name": EmailConfig.FROM_NAME},
             **kwargs
         )
@@ -216,27 +527,10 @@ class Email:
     @classmethod
     def send_reset_password(cls, to: str, name: str, reset_link: str, **kwargs) -> dict:
         """Send a password reset email (built-in template)"""
-        template = """
-        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <h1 style="color: #3b82f6;">Reset Your Password</h1>
-            <p>Hi {{name}},</p>
-            <p>We received a request to reset your password. Click the button below to create a new password:</p>
-            <p style="text-align: center; margin: 30px 0;">
-                <a href="{{reset_link}}" style="background: #3b82f6; color: white; padding: 12px 24px; 
-                   text-decoration: none; border-radius: 6px; display: inline-block;">
-                    Reset Password
-                </a>
-            </p>
-            <p style="color: #6b7280; font-size: 14px;">
-                If you didn't request this, you can safely ignore this email.
-            </p>
-            <p style="margin-top: 30px;">Best regards,<br>The {{app_name}} Team</p>
-        </div>
-        """
         return cls.send_template(
             to=to,
             subject="Reset Your Password",
-            template=template,
+            template=cls._RESET_TMPL,
             context={"name": name, "reset_link": reset_link, "app_name": EmailConfig.FROM_NAME},
             **kwargs
         )
@@ -244,27 +538,10 @@ class Email:
     @classmethod
     def send_verification(cls, to: str, name: str, code: str, **kwargs) -> dict:
         """Send an email verification code (built-in template)"""
-        template = """
-        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-            <h1 style="color: #3b82f6;">Verify Your Email</h1>
-            <p>Hi {{name}},</p>
-            <p>Your verification code is:</p>
-            <p style="text-align: center; margin: 30px 0;">
-                <span style="background: #f3f4f6; padding: 16px 32px; font-size: 32px; 
-                       font-weight: bold; letter-spacing: 8px; border-radius: 8px;">
-                    {{code}}
-                </span>
-            </p>
-            <p style="color: #6b7280; font-size: 14px;">
-                This code will expire in 10 minutes.
-            </p>
-            <p style="margin-top: 30px;">Best regards,<br>The {{app_name}} Team</p>
-        </div>
-        """
         return cls.send_template(
             to=to,
             subject="Your Verification Code",
-            template=template,
+            template=cls._VERIFY_TMPL,
             context={"name": name, "code": code, "app_name": EmailConfig.FROM_NAME},
             **kwargs
         )
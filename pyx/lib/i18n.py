@@ -4,13 +4,97 @@ Multi-language support for PyX applications.
 """
 import os
 import json
+import logging
+import string
+import sys
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from functools import wraps
+from functools import lru_cache, wraps
 
+try:
+    from orjson import loads as _loads  # Optional speedup (pip install usepyx[fast])
+except ImportError:
+    _loads = json.loads
 
-@dataclass
+
+logger = logging.getLogger("pyx.i18n")
+
+# Slotted dataclasses need 3.10+; older versions keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_MISSING = object()  # Cached marker for keys with no translation
+_EMPTY: Dict[str, Any] = {}  # Shared stand-in for a locale with no translations (never mutated)
+_PLURAL_FORMS = frozenset({"zero", "one", "two", "few", "many", "other"})
+_COUNT_FORMS = {1: "one", 0: "zero"}  # Exact counts with a dedicated form
+
+
+class _Plural(dict):
+    """Plural forms of one translation, tagged at load time"""
+    __slots__ = ()
+
+
+_formatter = string.Formatter()
+
+
+@lru_cache(maxsize=4096)
+def _compile_format(value: str):
+    """
+    Pre-parse a translation string once.
+    
+    Returns the finished text for strings without placeholders, a tuple of
+    (literal, field) parts for plain {name} fields, or None when str.format
+    is still needed (format specs, conversions, attribute/index access).
+    """
+    try:
+        parts = tuple(_formatter.parse(value))
+    except ValueError:
+        return None
+    if all(field is None for _, field, _, _ in parts):
+        return "".join(literal for literal, _, _, _ in parts)
+    for _, field, spec, conversion in parts:
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+    return tuple((literal, field) for literal, field, _, _ in parts)
+
+
+def _flatten(tree: Dict[str, Any], prefix: str = "", out: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Flatten nested translations to dotted keys ({"nav": {"home": ..}} -> {"nav.home": ..}).
+    
+    Plural dicts (only one/other/... keys) are kept whole as _Plural leaves.
+    """
+    if out is None:
+        out = {}
+    for name, value in tree.items():
+        key = prefix + name
+        if isinstance(value, dict) and not (value and value.keys() <= _PLURAL_FORMS):
+            _flatten(value, key + ".", out)
+        elif isinstance(value, dict):
+            out[key] = _Plural(value)
+        else:
+            out[key] = value
+    return out
+
+
+def _format(value: str, kwargs: Dict[str, Any]) -> str:
+    """Substitute kwargs into a translation string (raw string on a missing variable)"""
+    compiled = _compile_format(value)
+    if isinstance(compiled, str):
+        return compiled
+    try:
+        if compiled is None:
+            return value.format(**kwargs)
+        return "".join([
+            literal if field is None else literal + str(kwargs[field])
+            for literal, field in compiled
+        ])
+    except KeyError:
+        return value
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Locale:
     """Locale configuration"""
     code: str           # 'en', 'id', 'ja'
@@ -46,23 +130,16 @@ class I18n:
         t("items", count=5)  # "5 items"
     """
     
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
     def __init__(self):
-        if self._initialized:
-            return
-        
         self._translations: Dict[str, Dict[str, Any]] = {}
+        self._flat: Dict[str, Dict[str, Any]] = {}  # Same, keyed by dotted path
         self._current_locale: str = "en"
         self._fallback_locale: str = "en"
         self._locales: Dict[str, Locale] = {}
-        self._initialized = True
+        # (locale, key) -> resolved leaf (str / plural dict) or _MISSING
+        self._resolve_cache: Dict[tuple, Any] = {}
+        # (className, locale) -> rendered language_switcher HTML
+        self._switcher_cache: Dict[tuple, str] = {}
         
         # Default locales
         self.add_locale(Locale("en", "English", flag="🇺🇸"))
@@ -74,6 +151,7 @@ class I18n:
     def add_locale(self, locale: Locale):
         """Add a supported locale"""
         self._locales[locale.code] = locale
+        self._switcher_cache.clear()
     
     def load_translations(self, directory: str = "locales"):
         """
@@ -98,24 +176,42 @@ class I18n:
         locales_path = Path(directory)
         
         if not locales_path.exists():
-            print(f"⚠️  Locales directory '{directory}' not found")
+            logger.warning("Locales directory '%s' not found", directory)
             return
         
-        for file in locales_path.glob("*.json"):
-            locale_code = file.stem
+        files = list(locales_path.glob("*.json"))
+        
+        def read(file: Path):
             try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    self._translations[locale_code] = json.load(f)
-                print(f"   📄 Loaded {locale_code}.json")
+                return file, _loads(file.read_bytes()), None
             except Exception as e:
-                print(f"   ⚠️ Error loading {file}: {e}")
+                return file, None, e
+        
+        # Files are independent; read and parse them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(files) or 1)) as pool:
+            for file, data, error in pool.map(read, files):
+                if error is not None:
+                    logger.warning("Error loading %s: %s", file, error)
+                    continue
+                self._translations[file.stem] = data
+                self._flat[file.stem] = _flatten(data)
+                logger.info("Loaded %s.json", file.stem)
+        
+        self._resolve_cache.clear()
+        self._switcher_cache.clear()
+    
+    def supported_locale(self, locale: str) -> str:
+        """Return locale if it can be used, otherwise the fallback locale"""
+        if locale in self._locales or locale in self._translations:
+            return locale
+        return self._fallback_locale
     
     def set_locale(self, locale: str):
         """Set the current locale"""
         if locale in self._locales or locale in self._translations:
             self._current_locale = locale
         else:
-            print(f"⚠️  Locale '{locale}' not found, using fallback '{self._fallback_locale}'")
+            logger.warning("Locale '%s' not found, using fallback '%s'", locale, self._fallback_locale)
     
     def get_locale(self) -> str:
         """Get current locale code"""
@@ -139,44 +235,55 @@ class I18n:
             i18n.translate("greeting", name="John")
             i18n.translate("items", count=5)
         """
-        # Get translations for current locale, fallback to default
-        translations = self._translations.get(
-            self._current_locale, 
-            self._translations.get(self._fallback_locale, {})
-        )
-        
-        # Navigate nested keys (e.g., "nav.home")
-        value = translations
-        for part in key.split("."):
-            if isinstance(value, dict):
-                value = value.get(part)
-            else:
-                value = None
-                break
-        
+        cache_key = (self._current_locale, key)
+        value = self._resolve_cache.get(cache_key)
         if value is None:
+            value = self._resolve(key)
+            self._resolve_cache[cache_key] = value
+        
+        if value is _MISSING:
             # Key not found, return key itself
             return key
         
-        # Handle pluralization
-        if isinstance(value, dict) and "count" in kwargs:
-            count = kwargs["count"]
-            if count == 1 and "one" in value:
-                value = value["one"]
-            elif count == 0 and "zero" in value:
-                value = value["zero"]
+        # Handle pluralization: _Plural leaves, or sections that mix plural
+        # forms with other keys (returned as the plain nested dict)
+        if "count" in kwargs and isinstance(value, dict):
+            form = _COUNT_FORMS.get(kwargs["count"])
+            if form in value:
+                value = value[form]
             else:
                 value = value.get("other", value.get("many", str(value)))
         
         # Substitute variables
         if isinstance(value, str):
-            try:
-                return value.format(**kwargs)
-            except KeyError:
-                return value
+            return _format(value, kwargs)
         
         return str(value)
     
+    def _resolve(self, key: str) -> Any:
+        """Walk the nested translations for key in the current locale"""
+        # Get translations for current locale, fallback to default
+        flat = self._flat.get(self._current_locale)
+        if flat is None:
+            flat = self._flat.get(self._fallback_locale, _EMPTY)
+        
+        # Leaves and plural dicts are a single lookup in the flattened table
+        value = flat.get(key)
+        if value is not None:
+            return value
+        
+        # Intermediate sections (e.g. "nav"): navigate nested keys
+        value = self._translations.get(self._current_locale)
+        if value is None:
+            value = self._translations.get(self._fallback_locale, _EMPTY)
+        for part in key.split("."):
+            try:
+                value = value[part]
+            except (KeyError, TypeError):
+                return _MISSING
+        
+        return _MISSING if value is None else value
+    
     def t(self, key: str, **kwargs) -> str:
         """Shorthand for translate"""
         return self.translate(key, **kwargs)
@@ -192,11 +299,19 @@ class I18n:
         Usage:
             i18n.language_switcher()
         """
-        options = ""
-        for code, locale in self._locales.items():
-            if code in self._translations:
-                selected = "selected" if code == self._current_locale else ""
-                options += f'<option value="{code}" {selected}>{locale.flag} {locale.name}</option>'
+        # Rebuilt only when the locale set or loaded translations change
+        key = (className, self._current_locale)
+        html = self._switcher_cache.get(key)
+        if html is None:
+            html = self._switcher_cache[key] = self._render_switcher(className)
+        return html
+    
+    def _render_switcher(self, className: str) -> str:
+        options = "".join([
+            f'<option value="{code}" {"selected" if code == self._current_locale else ""}>{locale.flag} {locale.name}</option>'
+            for code, locale in self._locales.items()
+            if code in self._translations
+        ])
         
         return f'''
         <select onchange="PyxI18n.setLocale(this.value)" class="px-3 py-2 border rounded-lg {className}">
@@ -214,7 +329,7 @@ class I18n:
         '''
 
 
-# Global instance
+# Global instance (use this rather than constructing I18n())
 i18n = I18n()
 
 
@@ -254,6 +369,12 @@ def locale(code: str):
     return decorator
 
 
+@lru_cache(maxsize=512)
+def _parse_accept_language(header: str) -> str:
+    """Primary language of an Accept-Language header ("id-ID,en;q=0.9" -> "id")"""
+    return header.split(",", 1)[0].split("-", 1)[0].strip().lower()
+
+
 class LocaleMiddleware:
     """
     Middleware to detect and set locale from request.
@@ -277,12 +398,12 @@ class LocaleMiddleware:
         if not locale_code:
             accept_lang = request.headers.get("accept-language", "")
             if accept_lang:
-                # Parse first language
-                locale_code = accept_lang.split(",")[0].split("-")[0].strip()
+                # Parse first language (browsers send a handful of distinct values)
+                locale_code = _parse_accept_language(accept_lang)
         
-        # 4. Set locale
+        # 4. Set locale (unsupported codes use the fallback)
         if locale_code:
-            i18n.set_locale(locale_code)
+            i18n.set_locale(i18n.supported_locale(locale_code))
         
         return await next_handler(request)
 
@@ -335,11 +456,13 @@ def create_translation_files(directory: str = "locales", locales: List[str] = No
         }
     }
     
+    # Same template for every locale: serialize once, one write per file
+    payload = json.dumps(template, indent=2, ensure_ascii=False)
+    
     for locale_code in locales:
         file_path = locales_path / f"{locale_code}.json"
         if not file_path.exists():
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(template, f, indent=2, ensure_ascii=False)
+            file_path.write_text(payload, encoding='utf-8')
             print(f"✅ Created {file_path}")
         else:
             print(f"⚠️  {file_path} already exists, skipping")
@@ -1,18 +1,33 @@
 """
 PyX Background Jobs
 Simple background task queue for async operations.
+
+Logs to the "pyx.jobs" logger; per-job events are DEBUG, e.g.
+logging.getLogger("pyx.jobs").setLevel(logging.DEBUG) to see them.
 """
 import asyncio
+from collections import deque
+import heapq
+import itertools
+import logging
 import threading
 from typing import Callable, Any, Optional
-from datetime import datetime, timedelta
-from queue import Queue
+from queue import Empty, Queue
 import time
-import traceback
+
+
+logger = logging.getLogger("pyx.jobs")
+
+_WAKE = object()  # Queued by stop() to wake a worker blocked on the queue
 
 
 class Job:
     """Represents a background job"""
+    __slots__ = (
+        "func", "args", "kwargs", "delay", "name", "created_at",
+        "scheduled_at", "status", "result", "error",
+    )
+    
     def __init__(
         self,
         func: Callable,
@@ -26,8 +41,8 @@ class Job:
         self.kwargs = kwargs or {}
         self.delay = delay
         self.name = name or func.__name__
-        self.created_at = datetime.now()
-        self.scheduled_at = datetime.now() + timedelta(seconds=delay)
+        self.created_at = time.time()  # Wall-clock epoch seconds
+        self.scheduled_at = time.monotonic() + delay  # Monotonic clock, for ordering only
         self.status = "pending"  # pending, running, completed, failed
         self.result = None
         self.error = None
@@ -56,13 +71,20 @@ class BackgroundWorker:
         send_email.schedule(60, "user@example.com", "Hello", "World")  # Run after 60 seconds
     """
     
-    def __init__(self):
+    def __init__(self, history: int = 1000):
+        """
+        Args:
+            history: Finished jobs kept (each) for completed/failed stats
+        """
         self._queue = Queue()
-        self._scheduled = []
+        self._scheduled = []  # Min-heap of (scheduled_at, seq, job)
+        self._sched_counter = itertools.count()  # Tie-breaker, keeps FIFO order
         self._running = False
         self._thread = None
-        self._completed_jobs = []
-        self._failed_jobs = []
+        self._stop_event: Optional[threading.Event] = None  # One per start()
+        # Bounded so a long-running worker doesn't pin every finished job
+        self._completed_jobs: deque = deque(maxlen=history)
+        self._failed_jobs: deque = deque(maxlen=history)
     
     def start(self):
         """Start the background worker"""
@@ -70,60 +92,80 @@ class BackgroundWorker:
             return
         
         self._running = True
-        self._thread = threading.Thread(target=self._worker_loop, daemon=True)
+        # A fresh event per thread: a worker still finishing a long job after
+        # stop() exits on its own event, and never stops its replacement
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._worker_loop, args=(self._stop_event,), daemon=True)
         self._thread.start()
-        print("[PyX Jobs] Background worker started")
+        logger.info("Background worker started")
     
     def stop(self):
         """Stop the background worker"""
         self._running = False
-        if self._thread:
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._queue.put(_WAKE)
             self._thread.join(timeout=5)
-        print("[PyX Jobs] Background worker stopped")
+        logger.info("Background worker stopped")
     
-    def _worker_loop(self):
+    def _worker_loop(self, stop: threading.Event):
         """Main worker loop"""
-        while self._running:
-            # Check scheduled jobs
-            now = datetime.now()
-            ready_jobs = [j for j in self._scheduled if j.scheduled_at <= now]
-            for job in ready_jobs:
-                self._scheduled.remove(job)
-                self._queue.put(job)
-            
-            # Process queue
-            if not self._queue.empty():
-                job = self._queue.get()
-                self._execute_job(job)
-            else:
-                time.sleep(0.1)  # Prevent CPU spinning
+        # One event loop, owned by this thread, for every async job
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            while not stop.is_set():
+                # Block until a job arrives or the nearest scheduled job is due
+                if self._scheduled:
+                    timeout = max(0, self._scheduled[0][0] - time.monotonic())
+                else:
+                    timeout = None
+                try:
+                    job = self._queue.get(timeout=timeout)
+                except Empty:
+                    job = None
+                
+                if job is _WAKE:
+                    continue  # Possibly left over from an earlier stop()
+                if job is not None:
+                    if job.delay > 0 and job.scheduled_at > time.monotonic():
+                        # Delayed job handed over by add()
+                        heapq.heappush(self._scheduled, (job.scheduled_at, next(self._sched_counter), job))
+                    else:
+                        self._execute_job(job, loop)
+                
+                # Run scheduled jobs that are due (nothing to do when none are)
+                if self._scheduled:
+                    now = time.monotonic()
+                    while self._scheduled and self._scheduled[0][0] <= now and not stop.is_set():
+                        _, _, job = heapq.heappop(self._scheduled)
+                        self._execute_job(job, loop)
+        finally:
+            loop.close()
     
-    def _execute_job(self, job: Job):
+    def _execute_job(self, job: Job, loop: asyncio.AbstractEventLoop):
         """Execute a single job"""
         job.status = "running"
-        print(f"[PyX Jobs] Running: {job.name}")
+        logger.debug("Running: %s", job.name)
         
         try:
             # Check if function is async
             if asyncio.iscoroutinefunction(job.func):
-                # Run async function
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+                # Run async function on the worker's loop
                 job.result = loop.run_until_complete(job.func(*job.args, **job.kwargs))
-                loop.close()
             else:
                 job.result = job.func(*job.args, **job.kwargs)
             
             job.status = "completed"
             self._completed_jobs.append(job)
-            print(f"[PyX Jobs] Completed: {job.name}")
+            logger.debug("Completed: %s", job.name)
             
         except Exception as e:
             job.status = "failed"
             job.error = str(e)
             self._failed_jobs.append(job)
-            print(f"[PyX Jobs] Failed: {job.name} - {str(e)}")
-            traceback.print_exc()
+            logger.error("Failed: %s - %s", job.name, e, exc_info=True)
     
     def add(self, func: Callable, *args, delay: float = 0, **kwargs) -> Job:
         """
@@ -137,12 +179,13 @@ class BackgroundWorker:
         """
         job = Job(func, args, kwargs, delay)
         
+        # Delayed jobs also go through the queue so a blocked worker wakes
+        # up and recomputes its next deadline
+        self._queue.put(job)
         if delay > 0:
-            self._scheduled.append(job)
-            print(f"[PyX Jobs] Scheduled: {job.name} in {delay}s")
+            logger.debug("Scheduled: %s in %ss", job.name, delay)
         else:
-            self._queue.put(job)
-            print(f"[PyX Jobs] Queued: {job.name}")
+            logger.debug("Queued: %s", job.name)
         
         return job
     
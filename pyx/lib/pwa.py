@@ -3,12 +3,35 @@ PyX Progressive Web App (PWA) Support
 Make PyX apps installable with offline support.
 """
 import json
+import logging
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
+from functools import cached_property
 
+logger = logging.getLogger("pyx.pwa")
 
-@dataclass
+# Slotted dataclasses need 3.10+; older versions keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _minify(source: str, line_comment: Optional[str] = None) -> str:
+    """
+    Conservative minifier for the generated JS/HTML.
+    
+    Strips indentation, blank lines and (if given) whole-line comments.
+    Line breaks are kept, so strings, URLs and JS semicolon insertion
+    are never affected.
+    """
+    lines = (line.strip() for line in source.splitlines())
+    return "\n".join(
+        line for line in lines
+        if line and not (line_comment and line.startswith(line_comment))
+    ) + "\n"
+
+
+@dataclass(frozen=True, **_SLOTS)
 class PWAIcon:
     """PWA Icon configuration"""
     src: str
@@ -17,10 +40,10 @@ class PWAIcon:
     purpose: str = "any maskable"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class PWAConfig:
     """
-    PWA Manifest configuration.
+    PWA Manifest configuration (immutable, so generated output can be cached).
     
     Usage:
         config = PWAConfig(
@@ -46,20 +69,26 @@ class PWAConfig:
     categories: List[str] = field(default_factory=list)
     screenshots: List[Dict] = field(default_factory=list)
     shortcuts: List[Dict] = field(default_factory=list)
+    _manifest: Dict = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.short_name:
-            self.short_name = self.name[:12]
+            object.__setattr__(self, "short_name", self.name[:12])
         
         # Default icons if none provided
         if not self.icons:
-            self.icons = [
+            object.__setattr__(self, "icons", [
                 PWAIcon("/icon-192.png", "192x192"),
                 PWAIcon("/icon-512.png", "512x512"),
-            ]
+            ])
+        
+        object.__setattr__(self, "_manifest", self._build_manifest())
     
     def to_manifest(self) -> Dict:
-        """Generate manifest.json content"""
+        """Generate manifest.json content (built once; treat as read-only)"""
+        return self._manifest
+    
+    def _build_manifest(self) -> Dict:
         manifest = {
             "name": self.name,
             "short_name": self.short_name,
@@ -112,32 +141,43 @@ class PWA:
     
     def __init__(self, config: PWAConfig):
         self.config = config
+        self._install_prompts: Dict[str, str] = {}
     
-    def generate(self, output_dir: str = "public"):
-        """Generate PWA files (manifest.json, service-worker.js)"""
+    def generate(self, output_dir: str = "public", minify: bool = True):
+        """
+        Generate PWA files (manifest.json, sw.js, offline.html).
+        
+        Args:
+            output_dir: Directory to write into
+            minify: Strip indentation/comments from sw.js and offline.html
+        """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
         # Generate manifest.json
         manifest_path = output_path / "manifest.json"
-        with open(manifest_path, 'w') as f:
-            json.dump(self.config.to_manifest(), f, indent=2)
-        print(f"✅ Generated {manifest_path}")
+        # Serialized up front and written in one call (json.dump writes per token)
+        manifest_path.write_text(
+            json.dumps(self.config.to_manifest(), indent=2, ensure_ascii=False),
+            encoding="utf-8"
+        )
+        logger.info("Generated %s", manifest_path)
         
         # Generate service worker
         sw_path = output_path / "sw.js"
-        with open(sw_path, 'w') as f:
-            f.write(self._generate_service_worker())
-        print(f"✅ Generated {sw_path}")
+        sw_js = _minify(self.sw_js, "//") if minify else self.sw_js
+        sw_path.write_text(sw_js, encoding="utf-8")
+        logger.info("Generated %s", sw_path)
         
         # Generate offline page
         offline_path = output_path / "offline.html"
-        with open(offline_path, 'w') as f:
-            f.write(self._generate_offline_page())
-        print(f"✅ Generated {offline_path}")
+        offline_html = _minify(self.offline_html) if minify else self.offline_html
+        offline_path.write_text(offline_html, encoding="utf-8")
+        logger.info("Generated %s", offline_path)
     
-    def _generate_service_worker(self) -> str:
-        """Generate service worker JavaScript"""
+    @cached_property
+    def sw_js(self) -> str:
+        """Service worker JavaScript"""
         return f'''// PyX Service Worker
 const CACHE_NAME = 'pyx-cache-v1';
 const OFFLINE_URL = '/offline.html';
@@ -240,8 +280,9 @@ self.addEventListener('notificationclick', (event) => {{
 }});
 '''
     
-    def _generate_offline_page(self) -> str:
-        """Generate offline fallback page"""
+    @cached_property
+    def offline_html(self) -> str:
+        """Offline fallback page"""
         return f'''<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -277,6 +318,11 @@ self.addEventListener('notificationclick', (event) => {{
         Generate head tags for PWA.
         Include this in your HTML head.
         """
+        return self.head_html
+    
+    @cached_property
+    def head_html(self) -> str:
+        """PWA head tags (see head_tags)"""
         return f'''
 <!-- PWA Meta Tags -->
 <meta name="application-name" content="{self.config.short_name}">
@@ -313,6 +359,12 @@ self.addEventListener('notificationclick', (event) => {{
         Generate install prompt component.
         Shows a button to install the PWA.
         """
+        html = self._install_prompts.get(button_text)
+        if html is None:
+            html = self._install_prompts[button_text] = self._render_install_prompt(button_text)
+        return html
+    
+    def _render_install_prompt(self, button_text: str) -> str:
         return f'''
 <div id="pwa-install-prompt" class="hidden fixed bottom-4 right-4 p-4 bg-white rounded-lg shadow-lg border z-50">
     <div class="flex items-center gap-4">
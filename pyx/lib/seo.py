@@ -1,8 +1,38 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Union, Any, Callable
-from functools import wraps
+from functools import lru_cache, wraps
 import json
 
+# Single-pass escape for text and double-quoted attribute values
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def _esc(value: Any) -> str:
+    return str(value).translate(_HTML_ESCAPE)
+
+
+# Compact JSON-LD; <, > and & become \u escapes so a value can't close the <script>
+_LD_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, check_circular=False)
+_LD_ESCAPE = str.maketrans({"<": "\\u003c", ">": "\\u003e", "&": "\\u0026"})
+
+
+# (attribute, property) pairs rendered as one <meta> each when set
+_OG_FIELDS = (
+    ("title", "og:title"),
+    ("description", "og:description"),
+    ("url", "og:url"),
+    ("site_name", "og:site_name"),
+    ("type", "og:type"),
+    ("locale", "og:locale"),
+)
+_TWITTER_FIELDS = (
+    ("title", "twitter:title"),
+    ("description", "twitter:description"),
+    ("site", "twitter:site"),
+    ("creator", "twitter:creator"),
+)
+
+
 @dataclass
 class OpenGraph:
     """Type-safe Open Graph Metadata"""
@@ -115,70 +145,77 @@ class Head:
         self.extra_meta = extra_meta
     
     def render(self) -> str:
-        """Render to HTML head tags"""
-        m = self.metadata
-        tags = []
-        
-        # Basic meta
-        tags.append(f'<title>{m.title}</title>')
-        if m.description:
-            tags.append(f'<meta name="description" content="{m.description}">')
-        if m.keywords:
-            tags.append(f'<meta name="keywords" content="{", ".join(m.keywords)}">')
-        if m.authors:
-            tags.append(f'<meta name="author" content="{", ".join(m.authors)}">')
-        if m.canonical:
-            tags.append(f'<link rel="canonical" href="{m.canonical}">')
-        
-        # Open Graph
-        if m.open_graph:
-            og = m.open_graph
-            if og.title:
-                tags.append(f'<meta property="og:title" content="{og.title}">')
-            if og.description:
-                tags.append(f'<meta property="og:description" content="{og.description}">')
-            if og.url:
-                tags.append(f'<meta property="og:url" content="{og.url}">')
-            if og.site_name:
-                tags.append(f'<meta property="og:site_name" content="{og.site_name}">')
-            if og.type:
-                tags.append(f'<meta property="og:type" content="{og.type}">')
-            if og.locale:
-                tags.append(f'<meta property="og:locale" content="{og.locale}">')
-            for img in og.images:
-                tags.append(f'<meta property="og:image" content="{img}">')
-        
-        # Twitter Card
-        if m.twitter:
-            tw = m.twitter
-            tags.append(f'<meta name="twitter:card" content="{tw.card}">')
-            if tw.title:
-                tags.append(f'<meta name="twitter:title" content="{tw.title}">')
-            if tw.description:
-                tags.append(f'<meta name="twitter:description" content="{tw.description}">')
-            if tw.site:
-                tags.append(f'<meta name="twitter:site" content="{tw.site}">')
-            if tw.creator:
-                tags.append(f'<meta name="twitter:creator" content="{tw.creator}">')
-            for img in tw.images:
-                tags.append(f'<meta name="twitter:image" content="{img}">')
-        
-        # JSON-LD
-        if m.json_ld:
-            ld = m.json_ld if isinstance(m.json_ld, list) else [m.json_ld]
-            for item in ld:
-                tags.append(f'<script type="application/ld+json">{json.dumps(item)}</script>')
-        
-        # Extra meta
-        for key, value in self.extra_meta.items():
-            tags.append(f'<meta name="{key}" content="{value}">')
-        
-        return '\n'.join(tags)
+        """Render to HTML head tags (cached by content, so edits always show)"""
+        return _render_head(_head_key(self.metadata, self.extra_meta))
     
     def __str__(self):
         return self.render()
 
 
+def _head_key(m: Metadata, extra_meta: Dict[str, Any]) -> tuple:
+    """Hashable snapshot of everything a Head renders"""
+    og, tw = m.open_graph, m.twitter
+    ld = m.json_ld if isinstance(m.json_ld, list) else [m.json_ld] if m.json_ld else ()
+    return (
+        m.title,
+        m.description,
+        tuple(m.keywords) if m.keywords else None,
+        tuple(m.authors) if m.authors else None,
+        m.canonical,
+        (tuple([getattr(og, attr) for attr, _ in _OG_FIELDS]), tuple(og.images)) if og else None,
+        (tw.card, tuple([getattr(tw, attr) for attr, _ in _TWITTER_FIELDS]), tuple(tw.images)) if tw else None,
+        tuple([_LD_ENCODER.encode(item) for item in ld]),
+        tuple([(key, str(value)) for key, value in extra_meta.items()]),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _render_head(key: tuple) -> str:
+    """Render head tags from a _head_key() snapshot"""
+    title, description, keywords, authors, canonical, og, tw, ld, extra = key
+    tags = []
+    
+    # Basic meta
+    tags.append(f'<title>{_esc(title)}</title>')
+    if description:
+        tags.append(f'<meta name="description" content="{_esc(description)}">')
+    if keywords:
+        tags.append(f'<meta name="keywords" content="{_esc(", ".join(keywords))}">')
+    if authors:
+        tags.append(f'<meta name="author" content="{_esc(", ".join(authors))}">')
+    if canonical:
+        tags.append(f'<link rel="canonical" href="{_esc(canonical)}">')
+    
+    # Open Graph
+    if og:
+        values, images = og
+        tags.extend([
+            f'<meta property="{prop}" content="{_esc(value)}">'
+            for (_, prop), value in zip(_OG_FIELDS, values)
+            if value
+        ])
+        tags.extend([f'<meta property="og:image" content="{_esc(img)}">' for img in images])
+    
+    # Twitter Card
+    if tw:
+        card, values, images = tw
+        tags.append(f'<meta name="twitter:card" content="{_esc(card)}">')
+        tags.extend([
+            f'<meta name="{name}" content="{_esc(value)}">'
+            for (_, name), value in zip(_TWITTER_FIELDS, values)
+            if value
+        ])
+        tags.extend([f'<meta name="twitter:image" content="{_esc(img)}">' for img in images])
+    
+    # JSON-LD
+    tags.extend([f'<script type="application/ld+json">{item.translate(_LD_ESCAPE)}</script>' for item in ld])
+    
+    # Extra meta
+    tags.extend([f'<meta name="{key}" content="{_esc(value)}">' for key, value in extra])
+    
+    return '\n'.join(tags)
+
+
 def seo(
     title: str = None,
     description: str = None,
@@ -201,21 +238,24 @@ def seo(
             return ui.div(...)
     """
     def decorator(func: Callable):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Get the page content
-            content = func(*args, **kwargs)
-            
-            # Create head
-            head = Head(
+        def make_head() -> Head:
+            return Head(
                 title=title,
                 description=description,
                 og_image=og_image,
-                keywords=keywords,
+                keywords=list(keywords) if keywords else keywords,
                 canonical=canonical,
-                json_ld=json_ld,
+                json_ld=dict(json_ld) if json_ld else json_ld,
                 **extra
             )
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # Get the page content
+            content = func(*args, **kwargs)
+            # Own Head per call, so per-request edits never leak; rendering
+            # is cached by content, so identical heads still render once
+            head = make_head()
             
             # Attach metadata to content (for server to extract)
             if hasattr(content, '_seo'):
@@ -3,9 +3,40 @@ PyX Validation System
 Declarative input validation like Laravel.
 """
 import re
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Union
 
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+_ALPHA_DASH_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# Accepted date formats: Y-m-d, Y-m-d H:M:S, d/m/Y and m/d/Y
+_DATE_RE = re.compile(
+    r'(?:(\d{4})-(\d{1,2})-(\d{1,2})(?: (\d{1,2}):(\d{1,2}):(\d{1,2}))?'
+    r'|(\d{1,2})/(\d{1,2})/(\d{4}))\Z'
+)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> "re.Pattern":
+    """Compiled pattern for a regex: rule, cached per pattern string"""
+    return re.compile(pattern)
+
+
+def _as_str(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _valid_ymd(year: int, month: int, day: int) -> bool:
+    if year < 1 or not 1 <= month <= 12 or day < 1:
+        return False
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return day <= 29
+    return day <= _DAYS_IN_MONTH[month - 1]
+
+
 class ValidationError(Exception):
     """Validation error with field-specific messages"""
     def __init__(self, errors: Dict[str, List[str]]):
@@ -87,24 +118,36 @@ class Validator:
         "after": "{field} must be a date after {date}",
     }
     
+    # Rule name -> _rule_* function; filled in after the class body
+    _RULES: Dict[str, Any] = {}
+    
     def __init__(self, data: Dict[str, Any], rules: Dict[str, List[str]], messages: Dict[str, str] = None):
         self.data = data
         self.rules = rules
         self.custom_messages = messages or {}
         self.errors: Dict[str, List[str]] = {}
     
+    def __init_subclass__(cls, **kwargs):
+        # Subclasses may add or override _rule_* methods
+        super().__init_subclass__(**kwargs)
+        cls._RULES = _collect_rules(cls)
+    
     def validate(self) -> Dict[str, List[str]]:
         """Run validation and return errors dict"""
-        for field, rules in self.rules.items():
-            # Normalize rules to list
-            if isinstance(rules, str):
-                rules = [rules]
-            
-            for rule in rules:
-                self._validate_rule(field, rule)
+        for field, rule_name, params, method in self._schema():
+            self._validate_rule(field, rule_name, params, method)
         
         return self.errors
     
+    def _schema(self) -> tuple:
+        """Parsed rules: (field, rule_name, params, function) tuples"""
+        # Normalize rules to tuples; parsing is cached per distinct schema
+        schema = tuple(
+            (field, (rules,) if isinstance(rules, str) else tuple(rules))
+            for field, rules in self.rules.items()
+        )
+        return _parse_schema(type(self), schema)
+    
     def fails(self) -> bool:
         """Check if validation failed"""
         return len(self.errors) > 0
@@ -135,45 +178,35 @@ class Validator:
         """Get field value from data"""
         return self.data.get(field)
     
-    def _validate_rule(self, field: str, rule: str):
-        """Validate a single rule"""
+    def _validate_rule(self, field: str, rule_name: str, params: Optional[str], method):
+        """Validate a single (pre-parsed) rule"""
         value = self._get_value(field)
         
-        # Parse rule and parameters
-        if ":" in rule:
-            rule_name, params = rule.split(":", 1)
-        else:
-            rule_name = rule
-            params = None
-        
         # Skip non-required empty values
         if rule_name != "required" and (value is None or value == ""):
             return
         
         # Call validation method
-        method = getattr(self, f"_rule_{rule_name}", None)
-        if method:
-            method(field, value, params)
+        if method is not None:
+            method(self, field, value, params)
     
     # ==========================================
     # VALIDATION RULES
     # ==========================================
     
     def _rule_required(self, field: str, value: Any, params: str = None):
-        """Value must exist and not be empty"""
-        if value is None or value == "" or value == []:
+        """Value must exist and not be empty (0 and False count as present)"""
+        if value is None or (isinstance(value, (str, list, tuple, dict)) and not value):
             self._add_error(field, "required")
     
     def _rule_email(self, field: str, value: Any, params: str = None):
         """Must be valid email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, str(value)):
+        if not _EMAIL_RE.match(_as_str(value)):
             self._add_error(field, "email")
     
     def _rule_url(self, field: str, value: Any, params: str = None):
         """Must be valid URL format"""
-        pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-        if not re.match(pattern, str(value)):
+        if not _URL_RE.match(_as_str(value)):
             self._add_error(field, "url")
     
     def _rule_number(self, field: str, value: Any, params: str = None):
@@ -264,22 +297,22 @@ class Validator:
     
     def _rule_regex(self, field: str, value: Any, params: str = None):
         """Must match regex pattern"""
-        if not re.match(params, str(value)):
+        if not _compile_pattern(params).match(_as_str(value)):
             self._add_error(field, "regex")
     
     def _rule_alpha(self, field: str, value: Any, params: str = None):
         """Only letters"""
-        if not str(value).isalpha():
+        if not _as_str(value).isalpha():
             self._add_error(field, "alpha")
     
     def _rule_alpha_num(self, field: str, value: Any, params: str = None):
         """Letters and numbers"""
-        if not str(value).isalnum():
+        if not _as_str(value).isalnum():
             self._add_error(field, "alpha_num")
     
     def _rule_alpha_dash(self, field: str, value: Any, params: str = None):
         """Letters, numbers, dash, underscore"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', str(value)):
+        if not _ALPHA_DASH_RE.match(_as_str(value)):
             self._add_error(field, "alpha_dash")
     
     def _rule_confirmed(self, field: str, value: Any, params: str = None):
@@ -301,23 +334,45 @@ class Validator:
             self._add_error(field, "different", other=params)
     
     def _rule_date(self, field: str, value: Any, params: str = None):
-        """Must be valid date format"""
-        from datetime import datetime
-        formats = ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S"]
+        """Must be valid date format (Y-m-d, Y-m-d H:M:S, d/m/Y or m/d/Y)"""
+        match = _DATE_RE.match(_as_str(value))
         
         valid = False
-        for fmt in formats:
-            try:
-                datetime.strptime(str(value), fmt)
-                valid = True
-                break
-            except ValueError:
-                continue
+        if match:
+            year, month, day, hour, minute, second, a, b, slash_year = match.groups()
+            if year:
+                valid = _valid_ymd(int(year), int(month), int(day)) and (
+                    hour is None or (int(hour) <= 23 and int(minute) <= 59 and int(second) <= 59)
+                )
+            else:
+                # d/m/Y or m/d/Y
+                slash_year = int(slash_year)
+                valid = _valid_ymd(slash_year, int(b), int(a)) or _valid_ymd(slash_year, int(a), int(b))
         
         if not valid:
             self._add_error(field, "date")
 
 
+def _collect_rules(cls) -> Dict[str, Any]:
+    """Map rule names to their _rule_* functions (resolved through the MRO)"""
+    return {name[len("_rule_"):]: getattr(cls, name) for name in dir(cls) if name.startswith("_rule_")}
+
+
+# Rule dispatch table, built once instead of getattr(f"_rule_{name}") per rule
+Validator._RULES = _collect_rules(Validator)
+
+
+@lru_cache(maxsize=256)
+def _parse_schema(cls, schema: tuple) -> tuple:
+    """Split "name:params" rules once into (field, rule_name, params, function) tuples"""
+    parsed = []
+    for field, rules in schema:
+        for rule in rules:
+            rule_name, sep, params = rule.partition(":")
+            parsed.append((field, rule_name, params if sep else None, cls._RULES.get(rule_name)))
+    return tuple(parsed)
+
+
 def validate(
     data: Dict[str, Any],
     rules: Dict[str, Union[str, List[str]]],
@@ -351,6 +406,37 @@ def validate(
     return validator.validate()
 
 
+def validate_batch(
+    records: List[Dict[str, Any]],
+    rules: Dict[str, Union[str, List[str]]],
+    messages: Dict[str, str] = None
+) -> List[Dict[str, List[str]]]:
+    """
+    Validate many records (e.g. rows of a CSV import) against the same rules.
+    
+    Rules are parsed once and one validator is reused for every record.
+    
+    Returns:
+        One errors dict per record, in order (empty if that record is valid)
+        
+    Usage:
+        results = validate_batch(rows, {"email": ["required", "email"]})
+        invalid = {i: errors for i, errors in enumerate(results) if errors}
+    """
+    validator = Validator({}, rules, messages)
+    schema = validator._schema()
+    results = []
+    
+    for record in records:
+        validator.data = record
+        validator.errors = {}
+        for field, rule_name, params, method in schema:
+            validator._validate_rule(field, rule_name, params, method)
+        results.append(validator.errors)
+    
+    return results
+
+
 def validate_or_fail(
     data: Dict[str, Any],
     rules: Dict[str, Union[str, List[str]]],